@@ -211,7 +211,9 @@ def load_simulation_data(order_file: str, courier_file: str) -> Tuple[list, list
 def run_simulation(drivers, orders, strategy: str) -> Dict[str, Any]:
     """Run a simulation with the given strategy."""
     sim = Simulation(copy.deepcopy(drivers), copy.deepcopy(orders))
-    return sim.run(strategy=strategy, verbose=False)
+    results = sim.run(strategy=strategy, verbose=False)
+    # The UI panels read the Title-Case display keys
+    return sim.get_display_dict(results)
 
 
 # =============================================================================
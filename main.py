@@ -230,7 +230,8 @@ def run_simulation_safe(
     try:
         sim = Simulation(copy.deepcopy(drivers), copy.deepcopy(orders))
         results = sim.run(strategy=strategy, verbose=verbose)
-        return results
+        # The comparison table reads the Title-Case display keys
+        return sim.get_display_dict(results)
     except Exception as e:
         print(f"ERROR: Simulation failed for '{strategy}': {e}")
         import traceback
@@ -114,6 +114,15 @@ Stricter than MAX_PICKUP_DISTANCE_KM for brute-force combinations.
 Orders with pickups within this radius are considered bundle-worthy.
 """
 
+TSP_INSERTION_WARM_START: bool = False
+"""
+Reuse a cached optimal tour as a warm start when exactly one order is
+added to a known order set: the new pickup/dropoff is inserted at the
+cheapest feasible positions instead of re-running Held-Karp. Much faster
+for large bundles but heuristic (routes can be slightly longer), so it
+is off by default.
+"""
+
 MAX_DELIVERY_TIME_MINS: float = 52.0
 """
 HARD CONSTRAINT: Maximum delivery time from order creation.
@@ -159,6 +168,15 @@ OSRM_TIMEOUT_SECONDS: float = 5.0
 OSRM_CACHE_SIZE: int = 10000
 """Maximum number of route results to cache. Prevents repeated API calls."""
 
+OSRM_ASSUME_SYMMETRIC: bool = True
+"""
+Treat routes as direction-independent for caching: (A, B) and (B, A)
+share one canonical cache entry, so lookups cost a single probe. The
+route cache already served reverse-direction hits, so this matches the
+existing semantics; set False where one-way streets make directional
+durations matter, at the cost of a second probe per miss.
+"""
+
 HAVERSINE_FALLBACK_MULTIPLIER: float = 1.4
 """
 Multiplier applied to Haversine distance when OSRM fails.
@@ -20,29 +20,85 @@ Four dispatch strategies are available:
 
 from __future__ import annotations
 
-from itertools import permutations, combinations
+import math
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import permutations
 from typing import List, Tuple, Optional, Set, Dict, FrozenSet
-from functools import lru_cache
-import random
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the DP kernel runs as plain Python without it
+    _HAVE_NUMBA = False
 
 from . import utils, scoring, config
-from .models import Driver, Order, Bundle, DriverStatus, OrderStatus, Stop
+from .models import (
+    Driver, Order, Bundle, DriverStatus, OrderStatus, Stop,
+    STOP_PICKUP, minutes_of_day,
+)
 
 
 # =============================================================================
 # CACHING FOR TSP ROUTES
 # =============================================================================
 # Cache for TSP route calculations within a single dispatch cycle.
-# Key: (rounded_start_loc, frozenset_of_order_ids, frozenset_of_already_picked_up_ids)
-# Cleared at the start of each dispatch call to avoid stale data.
+# Order sets are encoded as packed int bitmasks (one bit per order id seen
+# this cycle, assigned in _order_bit): single-word hash and equality instead
+# of hashing tuples of strings. Cleared at the start of each dispatch call.
+# Key: (rounded_start_loc, order_mask, picked_up_mask)
+
+_tsp_cache: Dict[
+    Tuple[Tuple[float, float], int, int],
+    Tuple[List[Stop], float, Optional[np.ndarray]],
+] = {}
+
+# Per-cycle order_id -> bit assignment backing the bitmask cache keys
+
+_order_bit: Dict[str, int] = {}
+
+# Cache for the start-independent parts of find_optimal_route: the stop list,
+# pickup indices, stop-to-stop distance matrix and precedence array only depend
+# on the order set and picked-up set, so they can be shared across every driver
+# bidding on the same bundle within a cycle.
+# Key: (order_mask, picked_up_mask)
+
+_stop_dist_cache: Dict[
+    Tuple[int, int],
+    Tuple[List[Stop], np.ndarray, np.ndarray],
+] = {}
+
+# Cache for greedy max-cut splits. Pickup locations are fixed, so the split
+# for a given order set is deterministic; the recursion and the outer
+# run_combinatorial loop revisit mostly-overlapping sets.
+# Key: frozenset of order_ids; value: the two groups as order-id tuples.
+
+_maxcut_cache: Dict[FrozenSet[str], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+# Best tour found per order set, used as the warm start for the insertion
+# heuristic (TSP_INSERTION_WARM_START). Key: (order_mask, picked_up_mask).
+
+_warm_tour_cache: Dict[Tuple[int, int], List[Stop]] = {}
+
+# Pickup-to-pickup distances for the current dispatch cycle, published by
+# run_combinatorial so find_optimal_route can blit the pickup-pickup block
+# of its stop matrix instead of recomputing those haversines.
 
-_tsp_cache: Dict[Tuple[Tuple[float, float], FrozenSet[str], FrozenSet[str]], Tuple[List[Stop], float]] = {}
+_cycle_pickup_distances: Optional[Tuple[np.ndarray, Dict[str, int]]] = None
 
 
 def _clear_tsp_cache() -> None:
-    """Clear the TSP route cache. Call at start of each dispatch cycle."""
-    global _tsp_cache
+    """Clear the TSP route caches. Call at start of each dispatch cycle."""
+    global _tsp_cache, _cycle_pickup_distances
     _tsp_cache.clear()
+    _order_bit.clear()
+    _stop_dist_cache.clear()
+    _maxcut_cache.clear()
+    _warm_tour_cache.clear()
+    _cycle_pickup_distances = None
 
 
 def _round_loc(loc: Tuple[float, float], precision: int = 4) -> Tuple[float, float]:
@@ -50,69 +106,285 @@ def _round_loc(loc: Tuple[float, float], precision: int = 4) -> Tuple[float, flo
     return (round(loc[0], precision), round(loc[1], precision))
 
 
-def _build_distance_matrix(orders: List[Order]) -> Dict[Tuple[str, str], float]:
+def _build_distance_matrix(orders: List[Order]) -> Tuple[np.ndarray, Dict[str, int]]:
     """
     Build a distance matrix between order pickup locations.
-    
-    Returns dict mapping (order_id_1, order_id_2) -> distance in km.
+
+    Uses one broadcasted haversine computation over all pickups instead of
+    O(n^2) per-pair Python calls. Falls back to per-pair `utils.get_distance`
+    when road distances are enabled so the OSRM cache is still consulted.
+
+    Returns:
+        Tuple of (matrix, id_to_idx) where matrix[i, j] is the pickup-to-pickup
+        distance in km and id_to_idx maps order_id -> matrix row/column index.
+        Indexing a dense float array beats hashing (id, id) tuple keys in the
+        clustering inner loops.
     """
-    distances: Dict[Tuple[str, str], float] = {}
-    for i, o1 in enumerate(orders):
-        for j, o2 in enumerate(orders):
-            if i < j:
+    n = len(orders)
+    id_to_idx: Dict[str, int] = {o.order_id: i for i, o in enumerate(orders)}
+
+    if config.USE_ROAD_DISTANCE:
+        matrix = np.zeros((n, n), dtype=np.float64)
+        for i, o1 in enumerate(orders):
+            for j in range(i + 1, n):
+                o2 = orders[j]
                 dist = utils.get_distance(
                     o1.pickup_lat, o1.pickup_lng,
                     o2.pickup_lat, o2.pickup_lng
                 )
-                distances[(o1.order_id, o2.order_id)] = dist
-                distances[(o2.order_id, o1.order_id)] = dist
-    return distances
+                matrix[i, j] = dist
+                matrix[j, i] = dist
+        return matrix, id_to_idx
+
+    lats = np.fromiter((o.pickup_lat for o in orders), dtype=np.float64, count=n)
+    lngs = np.fromiter((o.pickup_lng for o in orders), dtype=np.float64, count=n)
+    return utils.haversine_matrix(lats, lngs), id_to_idx
+
+
+def _driver_pickup_matrix(drivers: List[Driver], orders: List[Order]) -> np.ndarray:
+    """
+    Build a (num_drivers, num_orders) matrix of driver-to-pickup distances.
+
+    One broadcasted haversine pass replaces O(D*O) per-pair Python calls in
+    the nearest-driver scans. Falls back to per-pair `utils.get_distance`
+    when road distances are enabled so the OSRM cache is still consulted.
+    """
+    if config.USE_ROAD_DISTANCE:
+        matrix = np.empty((len(drivers), len(orders)), dtype=np.float64)
+        for i, driver in enumerate(drivers):
+            for j, order in enumerate(orders):
+                matrix[i, j] = utils.get_distance(
+                    driver.current_lat, driver.current_lng,
+                    order.pickup_lat, order.pickup_lng
+                )
+        return matrix
+
+    d_lats = np.fromiter((d.current_lat for d in drivers), dtype=np.float64, count=len(drivers))
+    d_lngs = np.fromiter((d.current_lng for d in drivers), dtype=np.float64, count=len(drivers))
+    p_lats = np.fromiter((o.pickup_lat for o in orders), dtype=np.float64, count=len(orders))
+    p_lngs = np.fromiter((o.pickup_lng for o in orders), dtype=np.float64, count=len(orders))
+    return utils.haversine_cross(d_lats, d_lngs, p_lats, p_lngs)
+
+
+def _nearest_driver(drivers: List[Driver], order: Order) -> Tuple[int, float]:
+    """
+    Find the index of (and distance to) the driver nearest an order's pickup.
+
+    Small candidate lists (and road mode) use one vectorized matrix pass.
+    Larger fleets are bucketed into a ~1 km grid keyed by driver position;
+    rings of cells around the pickup are scanned outward and the scan only
+    stops once no unscanned ring can hold a closer driver, so the result --
+    including lowest-index tie-breaking -- matches the full argmin.
+    """
+    n = len(drivers)
+    if config.USE_ROAD_DISTANCE or n < 64:
+        dists = _driver_pickup_matrix(drivers, [order])[:, 0]
+        k = int(dists.argmin())
+        return k, float(dists[k])
+
+    cell_km = 1.0
+    lat_cell = cell_km / 111.0
+    lng_cell = cell_km / max(111.0 * math.cos(math.radians(order.pickup_lat)), 1e-6)
+
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for k, d in enumerate(drivers):
+        cell = (int(d.current_lat // lat_cell), int(d.current_lng // lng_cell))
+        grid.setdefault(cell, []).append(k)
+
+    cx = int(order.pickup_lat // lat_cell)
+    cy = int(order.pickup_lng // lng_cell)
+    max_ring = max(max(abs(gx - cx), abs(gy - cy)) for gx, gy in grid)
+
+    p_lats = np.array([order.pickup_lat])
+    p_lngs = np.array([order.pickup_lng])
+    best_k = -1
+    best_dist = float('inf')
+    for ring in range(max_ring + 1):
+        # Any driver in this ring is at least (ring - 1) cells away; the
+        # 0.9 factor absorbs grid-vs-great-circle slack near cell edges
+        if (ring - 1) * cell_km * 0.9 > best_dist:
+            break
+        members: List[int] = []
+        for dx in range(-ring, ring + 1):
+            for dy in range(-ring, ring + 1):
+                if max(abs(dx), abs(dy)) != ring:
+                    continue
+                bucket = grid.get((cx + dx, cy + dy))
+                if bucket:
+                    members.extend(bucket)
+        if not members:
+            continue
+        lats = np.fromiter((drivers[k].current_lat for k in members), dtype=np.float64, count=len(members))
+        lngs = np.fromiter((drivers[k].current_lng for k in members), dtype=np.float64, count=len(members))
+        dists = utils.haversine_cross(lats, lngs, p_lats, p_lngs)[:, 0]
+        for j, k in enumerate(members):
+            dkm = float(dists[j])
+            if dkm < best_dist or (dkm == best_dist and k < best_k):
+                best_dist = dkm
+                best_k = k
+
+    return best_k, best_dist
+
+
+def _nearby_pairs(
+    orders: List[Order],
+    matrix: np.ndarray,
+    id_to_idx: Dict[str, int],
+) -> List[Tuple[int, int]]:
+    """
+    Find all order pairs whose pickups lie within MAX_PICKUP_DISTANCE_KM.
+
+    Buckets pickups into a grid of threshold-sized cells so only orders in
+    the same or an adjacent cell are compared -- a dependency-free stand-in
+    for a k-d tree radius query. Candidates are verified against the exact
+    distance matrix, so the result matches the brute-force pair scan.
+
+    Returns:
+        Sorted list of (i, j) index pairs into `orders` with i < j.
+    """
+    n = len(orders)
+    if n < 2:
+        return []
+
+    threshold = config.MAX_PICKUP_DISTANCE_KM
+
+    # Cell sizes in degrees; longitude degrees shrink with latitude
+    lat_cell = threshold / 111.0
+    mean_lat = math.radians(sum(o.pickup_lat for o in orders) / n)
+    lng_cell = threshold / max(111.0 * math.cos(mean_lat), 1e-6)
+
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for k, order in enumerate(orders):
+        cell = (int(order.pickup_lat // lat_cell), int(order.pickup_lng // lng_cell))
+        grid.setdefault(cell, []).append(k)
+
+    pairs: List[Tuple[int, int]] = []
+    for (cx, cy), members in grid.items():
+        # Pairs within the cell
+        for a in range(len(members)):
+            ia = members[a]
+            row = matrix[id_to_idx[orders[ia].order_id]]
+            for b in range(a + 1, len(members)):
+                ib = members[b]
+                if row[id_to_idx[orders[ib].order_id]] <= threshold:
+                    pairs.append((ia, ib) if ia < ib else (ib, ia))
+        # Forward neighbour cells only, so each cell pair is visited once
+        for dx, dy in ((0, 1), (1, -1), (1, 0), (1, 1)):
+            others = grid.get((cx + dx, cy + dy))
+            if not others:
+                continue
+            for ia in members:
+                row = matrix[id_to_idx[orders[ia].order_id]]
+                for ib in others:
+                    if row[id_to_idx[orders[ib].order_id]] <= threshold:
+                        pairs.append((ia, ib) if ia < ib else (ib, ia))
+
+    # Sort to keep bundle generation order (and tie-breaking) deterministic
+    pairs.sort()
+    return pairs
+
+
+def _publish_cycle_travel_times(drivers: List[Driver], orders: List[Order]) -> None:
+    """
+    Precompute one symmetric travel-time matrix for the dispatch cycle.
+
+    Collects every point bidding can touch (driver positions plus pickups
+    and dropoffs of pending and in-flight orders) and builds the full
+    travel-time table in one vectorized pass, published to the scoring
+    module so calculate_trip_cost reads leg times from the table instead
+    of recomputing haversines per bundle-driver pair. Skipped in road
+    mode, where per-pair OSRM results carry their own cache.
+    """
+    if config.USE_ROAD_DISTANCE:
+        scoring.set_cycle_travel_times(None)
+        return
+
+    points: List[Tuple[float, float]] = []
+    index: Dict[Tuple[float, float], int] = {}
+
+    def _add(point: Tuple[float, float]) -> None:
+        if point not in index:
+            index[point] = len(points)
+            points.append(point)
+
+    for driver in drivers:
+        _add(driver.current_loc)
+        for order in driver.assigned_orders:
+            _add(order.pickup_loc)
+            _add(order.dropoff_loc)
+    for order in orders:
+        _add(order.pickup_loc)
+        _add(order.dropoff_loc)
+
+    if not points:
+        scoring.set_cycle_travel_times(None)
+        return
+
+    n = len(points)
+    lats = np.fromiter((p[0] for p in points), dtype=np.float64, count=n)
+    lngs = np.fromiter((p[1] for p in points), dtype=np.float64, count=n)
+    time_matrix = (utils.haversine_matrix(lats, lngs) / config.AVG_SPEED_KMH) * 60
+
+    scoring.set_cycle_travel_times((index, time_matrix))
 
 
 def _greedy_max_cut(
-    orders: List[Order], 
-    distances: Dict[Tuple[str, str], float]
+    orders: List[Order],
+    matrix: np.ndarray,
+    id_to_idx: Dict[str, int]
 ) -> Tuple[List[Order], List[Order]]:
     """
     Greedy approximation of max-cut to split orders into two groups.
-    
+
     Max-cut maximizes the sum of distances between the two groups,
     meaning orders within each group are spatially close.
-    
+
     This is a 0.5-approximation algorithm (guaranteed at least half of optimal).
     """
     if len(orders) <= 1:
         return orders, []
-    
-    # Start with random assignment
+
+    # Splits are pure functions of the order set (pickup locations are fixed),
+    # so reuse the cached result when the recursion or the outer dispatch loop
+    # revisits the same subset
+    key = frozenset(o.order_id for o in orders)
+    cached = _maxcut_cache.get(key)
+    if cached is not None:
+        by_id = {o.order_id: o for o in orders}
+        ids_a, ids_b = cached
+        return [by_id[oid] for oid in ids_a], [by_id[oid] for oid in ids_b]
+
     group_a: List[Order] = []
     group_b: List[Order] = []
-    
+
+    # Running distance from every order to each group, updated with one
+    # vector add per assignment instead of re-summing a row slice per order
+    sum_to_a = np.zeros(matrix.shape[0], dtype=np.float64)
+    sum_to_b = np.zeros(matrix.shape[0], dtype=np.float64)
+
     # Greedy: for each order, put it in the group that maximizes cut value
     for order in orders:
-        # Calculate sum of distances to each group
-        dist_to_a = sum(
-            distances.get((order.order_id, o.order_id), 0) 
-            for o in group_a
-        )
-        dist_to_b = sum(
-            distances.get((order.order_id, o.order_id), 0) 
-            for o in group_b
-        )
-        
+        i = id_to_idx[order.order_id]
+
         # Put in group that maximizes cut (opposite of where it's closest)
-        if dist_to_a >= dist_to_b:
+        if sum_to_a[i] >= sum_to_b[i]:
             group_a.append(order)
+            sum_to_a += matrix[:, i]
         else:
             group_b.append(order)
-    
+            sum_to_b += matrix[:, i]
+
+    _maxcut_cache[key] = (
+        tuple(o.order_id for o in group_a),
+        tuple(o.order_id for o in group_b),
+    )
     return group_a, group_b
 
 
 def generate_spatial_bundles(
     orders: List[Order],
     max_bundle_size: int = None,
-    prebuilt_distances: Optional[Dict[Tuple[str, str], float]] = None
+    prebuilt_distances: Optional[Tuple[np.ndarray, Dict[str, int]]] = None
 ) -> List[List[Order]]:
     """
     Generate bundles using recursive graph-cut spatial clustering.
@@ -133,32 +405,32 @@ def generate_spatial_bundles(
     Args:
         orders: List of orders to bundle
         max_bundle_size: Maximum bundle size to generate (default from config)
-        prebuilt_distances: Optional pre-computed distance matrix (optimization)
-        
+        prebuilt_distances: Optional pre-computed (matrix, id_to_idx) pair (optimization)
+
     Returns:
         List of order bundles (each bundle is a list of orders)
     """
     if max_bundle_size is None:
         max_bundle_size = config.MAX_BUNDLE_SIZE
-    
+
     if not orders:
         return []
-    
+
     # Use prebuilt distance matrix or build one
     if prebuilt_distances is not None:
-        distances = prebuilt_distances
+        matrix, id_to_idx = prebuilt_distances
     else:
-        distances = _build_distance_matrix(orders)
+        matrix, id_to_idx = _build_distance_matrix(orders)
     
     # Generate bundles recursively
     bundles: List[List[Order]] = []
     
     # Track seen bundle signatures for O(1) duplicate detection
-    seen_bundle_ids: Set[FrozenSet[str]] = set()
-    
+    seen_bundle_ids: Set[Tuple[str, ...]] = set()
+
     def add_bundle_if_new(bundle: List[Order]) -> None:
         """Add bundle only if not already seen."""
-        bundle_sig = frozenset(o.order_id for o in bundle)
+        bundle_sig = tuple(sorted(o.order_id for o in bundle))
         if bundle_sig not in seen_bundle_ids:
             seen_bundle_ids.add(bundle_sig)
             bundles.append(bundle)
@@ -178,7 +450,7 @@ def generate_spatial_bundles(
             add_bundle_if_new(order_group)
         
         # Split into two groups using max-cut
-        group_a, group_b = _greedy_max_cut(order_group, distances)
+        group_a, group_b = _greedy_max_cut(order_group, matrix, id_to_idx)
         
         # Add the split groups if within size limit
         if 1 < len(group_a) <= max_bundle_size:
@@ -198,13 +470,9 @@ def generate_spatial_bundles(
     
     # Also add pairs of nearby orders (important for small bundles)
     # This ensures we don't miss good 2-order bundles
-    # Now uses O(1) duplicate detection via seen_bundle_ids
-    for i, o1 in enumerate(orders):
-        for j, o2 in enumerate(orders):
-            if i < j:
-                dist = distances.get((o1.order_id, o2.order_id), float('inf'))
-                if dist <= config.MAX_PICKUP_DISTANCE_KM:
-                    add_bundle_if_new([o1, o2])
+    # Candidate pairs come from a spatial grid query instead of an n^2 scan
+    for i, j in _nearby_pairs(orders, matrix, id_to_idx):
+        add_bundle_if_new([orders[i], orders[j]])
     
     # Add all single orders if not already present (using O(1) lookup)
     for order in orders:
@@ -213,12 +481,320 @@ def generate_spatial_bundles(
     return bundles
 
 
+def _hk_solve(
+    n: int,
+    dist: np.ndarray,
+    dist_from_start: np.ndarray,
+    required_mask: np.ndarray,
+) -> Tuple[int, float, np.ndarray]:
+    """
+    Held-Karp DP kernel over flat arrays.
+
+    dp[mask * n + i] = minimum distance to visit all stops in 'mask',
+    ending at stop i; mask bit j is set if stop j has been visited.
+    Written in Numba-compatible style and JIT-compiled at import when
+    Numba is installed; the same body runs as plain Python otherwise.
+
+    Args:
+        n: Number of stops
+        dist: (n, n) pairwise stop distance matrix
+        dist_from_start: (n,) distances from the driver to each stop
+        required_mask: (n,) bitmask of stops that must precede each stop
+            (a dropoff's pickup bit, or 0 when unconstrained)
+
+    Returns:
+        Tuple of (best_last_stop, best_distance, flat_parent_array)
+    """
+    INF = np.inf
+    full_mask = (1 << n) - 1
+
+    # float32 tables: half the bytes through cache, twice the SIMD lanes
+    dp = np.full((1 << n) * n, INF, dtype=np.float32)
+    parent = np.full((1 << n) * n, -1, dtype=np.int32)
+
+    # Base case: visit first stop directly from start (no prerequisite)
+    for i in range(n):
+        if required_mask[i] == 0:
+            dp[(1 << i) * n + i] = dist_from_start[i]
+
+    # Fill DP table in order of increasing mask
+    for mask in range(1, full_mask + 1):
+        base = mask * n
+        for last in range(n):
+            cur = dp[base + last]
+            if cur == INF:
+                continue
+            if not (mask >> last) & 1:
+                continue  # 'last' must be in mask
+
+            # Try extending to each unvisited stop
+            for nxt in range(n):
+                if (mask >> nxt) & 1:
+                    continue  # Already visited
+
+                # Branch-free precedence check: all prerequisite bits in mask
+                req = required_mask[nxt]
+                if mask & req != req:
+                    continue  # Pickup not yet visited, can't do this dropoff
+
+                new_idx = (mask | (1 << nxt)) * n + nxt
+                new_dist = cur + dist[last, nxt]
+
+                if new_dist < dp[new_idx]:
+                    dp[new_idx] = new_dist
+                    parent[new_idx] = last
+
+    # Find the best final state (all stops visited)
+    best_dist = INF
+    best_last = -1
+    for i in range(n):
+        if dp[full_mask * n + i] < best_dist:
+            best_dist = dp[full_mask * n + i]
+            best_last = i
+
+    return best_last, best_dist, parent
+
+
+def _hk_solve_py(
+    n: int,
+    dist: np.ndarray,
+    dist_from_start: np.ndarray,
+    required_mask: np.ndarray,
+) -> Tuple[int, float, array]:
+    """
+    Pure-Python Held-Karp fallback used when Numba is unavailable.
+
+    Same algorithm as _hk_solve, but backed by flat array.array buffers:
+    dense contiguous doubles/ints instead of 2^n boxed numpy scalars per
+    lookup, which is substantially faster under the plain interpreter.
+    """
+    INF = float('inf')
+    full_mask = (1 << n) - 1
+
+    dp = array('d', [INF]) * ((1 << n) * n)
+    parent = array('i', [-1]) * ((1 << n) * n)
+
+    # Plain nested lists index faster than numpy arrays from the interpreter
+    dist_rows = dist.tolist()
+    start_dists = dist_from_start.tolist()
+    req = required_mask.tolist()
+
+    for i in range(n):
+        if req[i] == 0:
+            dp[(1 << i) * n + i] = start_dists[i]
+
+    # Iterate only the set (visited) / clear (unvisited) bits of each mask
+    # via lowest-set-bit extraction, rather than scanning all n positions
+    for mask in range(1, full_mask + 1):
+        base = mask * n
+        bits = mask
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            last = low.bit_length() - 1
+
+            cur = dp[base + last]
+            if cur == INF:
+                continue
+
+            dist_last = dist_rows[last]
+            unvisited = full_mask ^ mask
+            while unvisited:
+                nlow = unvisited & -unvisited
+                unvisited ^= nlow
+                nxt = nlow.bit_length() - 1
+
+                r = req[nxt]
+                if mask & r != r:
+                    continue
+
+                new_idx = (mask | nlow) * n + nxt
+                new_dist = cur + dist_last[nxt]
+
+                if new_dist < dp[new_idx]:
+                    dp[new_idx] = new_dist
+                    parent[new_idx] = last
+
+    best_dist = INF
+    best_last = -1
+    for i in range(n):
+        if dp[full_mask * n + i] < best_dist:
+            best_dist = dp[full_mask * n + i]
+            best_last = i
+
+    return best_last, best_dist, parent
+
+
+if _HAVE_NUMBA:
+    # Compile eagerly at import with an explicit signature so the first
+    # dispatch cycle doesn't pay JIT latency (the binary is disk-cached);
+    # the signature pins the float32 layout the caller provides
+    from numba import types as _nb_types
+
+    _hk_sig = _nb_types.Tuple((_nb_types.int64, _nb_types.float64, _nb_types.int32[::1]))(
+        _nb_types.int64,
+        _nb_types.float32[:, ::1],
+        _nb_types.float32[::1],
+        _nb_types.int64[::1],
+    )
+    _hk_solve = njit([_hk_sig], cache=True, nogil=True)(_hk_solve)
+else:
+    _hk_solve = _hk_solve_py
+
+
+def _tsp_small(
+    n: int,
+    dist: np.ndarray,
+    dist_from_start: np.ndarray,
+    required_mask: np.ndarray,
+) -> Tuple[Optional[Tuple[int, ...]], float]:
+    """
+    Fast path for small stop counts: enumerate all permutations directly.
+
+    For n <= 4 there are at most 24 permutations, so exhaustive enumeration
+    with inline precedence checks beats Held-Karp's table allocation. This
+    covers 1- and 2-order bundles, the bulk of TSP calls during dispatch.
+
+    Returns:
+        Tuple of (best_stop_order, best_distance); best_stop_order is None
+        if no permutation satisfies the precedence constraints.
+    """
+    dist_rows = dist.tolist()
+    start_dists = dist_from_start.tolist()
+    req = required_mask.tolist()
+
+    best_dist = float('inf')
+    best_perm: Optional[Tuple[int, ...]] = None
+
+    for perm in permutations(range(n)):
+        first = perm[0]
+        if req[first]:
+            continue  # Can't start with a dropoff whose pickup is pending
+
+        total = start_dists[first]
+        visited = 1 << first
+        prev = first
+        ok = True
+
+        for idx in range(1, n):
+            nxt = perm[idx]
+            r = req[nxt]
+            if visited & r != r:
+                ok = False  # Pickup not yet visited
+                break
+            total += dist_rows[prev][nxt]
+            if total >= best_dist:
+                ok = False  # Already worse than the best tour
+                break
+            visited |= 1 << nxt
+            prev = nxt
+
+        if ok and total < best_dist:
+            best_dist = total
+            best_perm = perm
+
+    return best_perm, best_dist
+
+
+def _insertion_route(
+    start_loc: Tuple[float, float],
+    orders: List[Order],
+    already_picked_up_ids: Set[str],
+    order_mask: int,
+    picked_up_mask: int,
+) -> Optional[Tuple[List[Stop], float]]:
+    """
+    Warm-start heuristic: extend a cached tour by inserting one new order.
+
+    If the order set is a cached set plus exactly one new order, the new
+    pickup/dropoff pair is placed at the cheapest positions in the cached
+    tour (pickup before dropoff) instead of re-running Held-Karp -- O(n^2)
+    insertion scan vs an exponential cold solve. Only used when
+    config.TSP_INSERTION_WARM_START is enabled.
+
+    Returns:
+        Tuple of (stop_sequence, total_distance), or None when no cached
+        tour can seed the insertion.
+    """
+    if len(orders) < 2:
+        return None
+
+    for new_order in orders:
+        if new_order.order_id in already_picked_up_ids:
+            continue  # In-vehicle orders are never the freshly added one
+        base = _warm_tour_cache.get(
+            (order_mask ^ _order_bit[new_order.order_id], picked_up_mask)
+        )
+        if base:
+            break
+    else:
+        return None
+
+    m = len(base)
+    locs = [start_loc] + [s.location for s in base]
+
+    # Leg distances of the base tour from this driver's position
+    legs = [
+        utils.get_distance(locs[k][0], locs[k][1], locs[k + 1][0], locs[k + 1][1])
+        for k in range(m)
+    ]
+    base_total = sum(legs)
+
+    p_loc = new_order.pickup_loc
+    d_loc = new_order.dropoff_loc
+
+    def _d(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+        return utils.get_distance(a[0], a[1], b[0], b[1])
+
+    d_pd = _d(p_loc, d_loc)
+
+    best_delta = float('inf')
+    best_p = best_q = 0
+
+    # Insert pickup before base[p] and dropoff before base[q] (p <= q);
+    # index m means appending after the last stop (routes are open paths)
+    for p in range(m + 1):
+        a = locs[p]  # Stop (or start) preceding the pickup
+        if p == m:
+            # Pickup appended at the end; dropoff must follow directly
+            delta = _d(a, p_loc) + d_pd
+            if delta < best_delta:
+                best_delta, best_p, best_q = delta, p, p
+            break
+
+        b = locs[p + 1]
+        pickup_delta = _d(a, p_loc) + _d(p_loc, b) - legs[p]
+
+        # Dropoff immediately after the pickup
+        delta = _d(a, p_loc) + d_pd + _d(d_loc, b) - legs[p]
+        if delta < best_delta:
+            best_delta, best_p, best_q = delta, p, p
+
+        # Dropoff at a later slot
+        for q in range(p + 1, m + 1):
+            if q == m:
+                delta = pickup_delta + _d(locs[m], d_loc)
+            else:
+                delta = pickup_delta + _d(locs[q], d_loc) + _d(d_loc, locs[q + 1]) - legs[q]
+            if delta < best_delta:
+                best_delta, best_p, best_q = delta, p, q
+
+    pickup_stop = Stop(location=p_loc, stop_type='PICKUP', order_id=new_order.order_id)
+    dropoff_stop = Stop(location=d_loc, stop_type='DROPOFF', order_id=new_order.order_id)
+
+    route = list(base)
+    route.insert(best_q, dropoff_stop)
+    route.insert(best_p, pickup_stop)
+
+    return route, base_total + best_delta
+
+
 def find_optimal_route(
     start_loc: Tuple[float, float], 
     orders: List[Order], 
     already_picked_up: Optional[List[Order]] = None,
     use_cache: bool = True
-) -> Tuple[List[Stop], float]:
+) -> Tuple[List[Stop], float, Optional[np.ndarray]]:
     """
     Find the shortest route for a driver to complete a set of orders.
     
@@ -247,157 +823,265 @@ def find_optimal_route(
         use_cache: Whether to use TSP cache (default True)
         
     Returns:
-        Tuple of (optimal_stop_sequence, total_distance_km)
-        Returns ([], 0.0) if no orders provided
+        Tuple of (optimal_stop_sequence, total_distance_km, tail_leg_times).
+        tail_leg_times holds the stop-to-stop travel minutes (element 0 is
+        zero; the driver-dependent first leg is the caller's to fill).
+        Returns ([], 0.0, None) if no route is possible.
     """
     global _tsp_cache
-    
+
     if not orders:
-        return [], 0.0
-    
+        return [], 0.0, None
+
     if already_picked_up is None:
         already_picked_up = []
     
     already_picked_up_ids: Set[str] = {o.order_id for o in already_picked_up}
-    order_ids: FrozenSet[str] = frozenset(o.order_id for o in orders)
-    picked_up_frozen: FrozenSet[str] = frozenset(already_picked_up_ids)
-    
+
+    # Pack the order and picked-up sets into int bitmasks: single-word hash
+    # and equality for every cache key instead of sorted string tuples
+    bit = _order_bit
+    order_mask = 0
+    for o in orders:
+        b = bit.get(o.order_id)
+        if b is None:
+            b = 1 << len(bit)
+            bit[o.order_id] = b
+        order_mask |= b
+    picked_up_mask = 0
+    for oid in already_picked_up_ids:
+        picked_up_mask |= bit[oid]
+
     # Check cache
     if use_cache:
         rounded_start = _round_loc(start_loc)
-        cache_key = (rounded_start, order_ids, picked_up_frozen)
+        cache_key = (rounded_start, order_mask, picked_up_mask)
         if cache_key in _tsp_cache:
             return _tsp_cache[cache_key]
 
-    # Create all required stops and track pickup indices for precedence checking
-    all_stops: List[Stop] = []
-    pickup_idx: Dict[str, int] = {}  # order_id -> index of its pickup stop
-    
-    for order in orders:
-        # Only add pickup stop if not already in vehicle
-        if order.order_id not in already_picked_up_ids:
-            pickup_idx[order.order_id] = len(all_stops)
+        # Optional warm start: grow a cached tour by one inserted order
+        # instead of a cold Held-Karp solve
+        if config.TSP_INSERTION_WARM_START:
+            warm = _insertion_route(start_loc, orders, already_picked_up_ids,
+                                    order_mask, picked_up_mask)
+            if warm is not None:
+                result = (warm[0], warm[1], scoring.route_tail_leg_times(warm[0]))
+                _tsp_cache[cache_key] = result
+                _warm_tour_cache[(order_mask, picked_up_mask)] = warm[0]
+                return result
+
+    # The stop list, stop-to-stop distances and precedence constraints only
+    # depend on the order set, not the driver, so they are shared across all
+    # drivers bidding on the same bundle within a cycle.
+    stop_key = (order_mask, picked_up_mask)
+    cached = _stop_dist_cache.get(stop_key) if use_cache else None
+
+    if cached is not None:
+        all_stops, dist, required_mask_arr = cached
+        n = len(all_stops)
+    else:
+        # Create all required stops and track pickup indices for precedence checking
+        all_stops = []
+        pickup_idx: Dict[str, int] = {}  # order_id -> index of its pickup stop
+
+        for order in orders:
+            # Only add pickup stop if not already in vehicle
+            if order.order_id not in already_picked_up_ids:
+                pickup_idx[order.order_id] = len(all_stops)
+                all_stops.append(Stop(
+                    location=order.pickup_loc,
+                    stop_type='PICKUP',
+                    order_id=order.order_id
+                ))
             all_stops.append(Stop(
-                location=order.pickup_loc, 
-                stop_type='PICKUP', 
+                location=order.dropoff_loc,
+                stop_type='DROPOFF',
                 order_id=order.order_id
             ))
-        all_stops.append(Stop(
-            location=order.dropoff_loc, 
-            stop_type='DROPOFF', 
-            order_id=order.order_id
-        ))
-    
-    n = len(all_stops)
-    if n == 0:
-        return [], 0.0
-    
-    # Precompute all distances (avoid repeated get_distance calls)
-    dist_from_start: List[float] = []
-    for stop in all_stops:
-        dist_from_start.append(utils.get_distance(
-            start_loc[0], start_loc[1],
-            stop.location[0], stop.location[1]
-        ))
-    
-    dist: List[List[float]] = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = utils.get_distance(
-                all_stops[i].location[0], all_stops[i].location[1],
-                all_stops[j].location[0], all_stops[j].location[1]
-            )
-            dist[i][j] = d
-            dist[j][i] = d
-    
-    # Precompute which stops are dropoffs and their required pickup indices
-    # -1 means no pickup required (either it's a pickup, or already picked up)
-    required_pickup: List[int] = []
-    for i, stop in enumerate(all_stops):
-        if stop.stop_type == 'PICKUP':
-            required_pickup.append(-1)  # Pickups have no prerequisite
+
+        n = len(all_stops)
+        if n == 0:
+            return [], 0.0, None
+
+        # Precompute stop-to-stop distances (avoid repeated get_distance calls)
+        if config.USE_ROAD_DISTANCE:
+            # Per-pair path so OSRM-cached road distances are consulted
+            dist = np.zeros((n, n), dtype=np.float64)
+            for i in range(n):
+                for j in range(i + 1, n):
+                    d = utils.get_distance(
+                        all_stops[i].location[0], all_stops[i].location[1],
+                        all_stops[j].location[0], all_stops[j].location[1]
+                    )
+                    dist[i, j] = d
+                    dist[j, i] = d
         else:
-            # Dropoff: need to check if pickup was visited
-            order_id = stop.order_id
-            if order_id in already_picked_up_ids:
-                required_pickup.append(-1)  # Already picked up, no constraint
+            coords = np.empty((n, 2), dtype=np.float64)
+            for i, stop in enumerate(all_stops):
+                coords[i] = stop.location
+
+            shared = _cycle_pickup_distances
+            pickup_rows = [i for i, s in enumerate(all_stops) if s.stop_type_code == STOP_PICKUP]
+            if (
+                shared is not None
+                and len(pickup_rows) > 1
+                and all(all_stops[i].order_id in shared[1] for i in pickup_rows)
+            ):
+                # Reuse the cycle's pickup-pickup distances; only the blocks
+                # involving dropoffs need fresh haversines
+                matrix, id_to_idx = shared
+                other_rows = [i for i, s in enumerate(all_stops) if s.stop_type_code != STOP_PICKUP]
+                pk = [id_to_idx[all_stops[i].order_id] for i in pickup_rows]
+
+                dist = np.empty((n, n), dtype=np.float64)
+                dist[np.ix_(pickup_rows, pickup_rows)] = matrix[np.ix_(pk, pk)]
+
+                cross = utils.haversine_cross(
+                    coords[pickup_rows, 0], coords[pickup_rows, 1],
+                    coords[other_rows, 0], coords[other_rows, 1],
+                )
+                dist[np.ix_(pickup_rows, other_rows)] = cross
+                dist[np.ix_(other_rows, pickup_rows)] = cross.T
+                dist[np.ix_(other_rows, other_rows)] = utils.haversine_matrix(
+                    coords[other_rows, 0], coords[other_rows, 1]
+                )
             else:
-                required_pickup.append(pickup_idx[order_id])
-    
-    # ============================================================
-    # HELD-KARP DYNAMIC PROGRAMMING
-    # ============================================================
-    # dp[mask][i] = minimum distance to visit all stops in 'mask', ending at stop i
-    # mask is a bitmask where bit j is set if stop j has been visited
-    
-    INF = float('inf')
-    full_mask = (1 << n) - 1
-    
-    # Initialize DP table
-    dp: List[List[float]] = [[INF] * n for _ in range(1 << n)]
-    parent: List[List[int]] = [[-1] * n for _ in range(1 << n)]
-    
-    # Base case: visit first stop directly from start
-    for i in range(n):
-        req = required_pickup[i]
-        if req == -1:  # Can visit this stop first (no prerequisite)
-            dp[1 << i][i] = dist_from_start[i]
-    
-    # Fill DP table in order of increasing mask size
-    for mask in range(1, 1 << n):
-        for last in range(n):
-            if dp[mask][last] == INF:
-                continue
-            if not (mask & (1 << last)):
-                continue  # 'last' must be in mask
-            
-            # Try extending to each unvisited stop
-            for nxt in range(n):
-                if mask & (1 << nxt):
-                    continue  # Already visited
-                
-                # Check precedence constraint
-                req = required_pickup[nxt]
-                if req != -1 and not (mask & (1 << req)):
-                    continue  # Pickup not yet visited, can't do this dropoff
-                
-                new_mask = mask | (1 << nxt)
-                new_dist = dp[mask][last] + dist[last][nxt]
-                
-                if new_dist < dp[new_mask][nxt]:
-                    dp[new_mask][nxt] = new_dist
-                    parent[new_mask][nxt] = last
-    
-    # Find the best final state (all stops visited)
-    best_dist = INF
-    best_last = -1
-    for i in range(n):
-        if dp[full_mask][i] < best_dist:
-            best_dist = dp[full_mask][i]
-            best_last = i
-    
-    if best_last == -1 or best_dist == INF:
-        return [], 0.0
-    
-    # Reconstruct the optimal path by following parent pointers
-    path_indices: List[int] = []
-    mask = full_mask
-    curr = best_last
-    
-    while curr != -1:
-        path_indices.append(curr)
-        prev = parent[mask][curr]
-        mask = mask ^ (1 << curr)  # Remove curr from mask
-        curr = prev
-    
-    path_indices.reverse()
+                dist = utils.haversine_matrix(coords[:, 0], coords[:, 1])
+
+        # Precompute each stop's prerequisite bitmask: for a dropoff, the bit
+        # of its pickup stop; 0 when unconstrained (pickups, in-vehicle orders)
+        required_mask: List[int] = []
+        for stop in all_stops:
+            if stop.stop_type_code == STOP_PICKUP:
+                required_mask.append(0)  # Pickups have no prerequisite
+            else:
+                # Dropoff: need to check if pickup was visited
+                order_id = stop.order_id
+                if order_id in already_picked_up_ids:
+                    required_mask.append(0)  # Already picked up, no constraint
+                else:
+                    required_mask.append(1 << pickup_idx[order_id])
+        required_mask_arr = np.asarray(required_mask, dtype=np.int64)
+
+        # float32 halves the DP kernel's memory traffic; city-scale distances
+        # need ~7 significant digits at most, well within float32 precision
+        dist = dist.astype(np.float32)
+
+        if use_cache:
+            _stop_dist_cache[stop_key] = (all_stops, dist, required_mask_arr)
+
+    # Only the start->stop leg depends on the driver's position
+    if config.USE_ROAD_DISTANCE:
+        dist_from_start = np.empty(n, dtype=np.float64)
+        for i, stop in enumerate(all_stops):
+            dist_from_start[i] = utils.get_distance(
+                start_loc[0], start_loc[1],
+                stop.location[0], stop.location[1]
+            )
+    else:
+        stop_lats = np.fromiter((s.location[0] for s in all_stops), dtype=np.float64, count=n)
+        stop_lngs = np.fromiter((s.location[1] for s in all_stops), dtype=np.float64, count=n)
+        dist_from_start = utils.haversine_vector(start_loc[0], start_loc[1], stop_lats, stop_lngs)
+    dist_from_start = np.asarray(dist_from_start, dtype=np.float32)
+
+    if n <= 4:
+        # Small bundles finish faster by enumerating the <=24 permutations
+        # than by allocating the Held-Karp tables
+        best_perm, best_dist = _tsp_small(n, dist, dist_from_start, required_mask_arr)
+        if best_perm is None:
+            return [], 0.0, None
+        path_indices = list(best_perm)
+    else:
+        # Run the Held-Karp DP kernel (JIT-compiled when Numba is available)
+        best_last, best_dist, parent = _hk_solve(
+            n,
+            dist,
+            dist_from_start,
+            required_mask_arr,
+        )
+
+        if best_last == -1 or best_dist == np.inf:
+            return [], 0.0, None
+
+        # Reconstruct the optimal path by following parent pointers
+        full_mask = (1 << n) - 1
+        path_indices = []
+        mask = full_mask
+        curr = best_last
+
+        while curr != -1:
+            path_indices.append(curr)
+            prev = int(parent[mask * n + curr])
+            mask = mask ^ (1 << curr)  # Remove curr from mask
+            curr = prev
+
+        path_indices.reverse()
+
     best_route_stops = [all_stops[i] for i in path_indices]
-    
+    best_dist = float(best_dist)
+
+    # Stop-to-stop leg times are driver-independent, so compute them once
+    # here and cache them with the route; callers fill in the first leg
+    # from the driver's exact position
+    tail_leg_times = scoring.route_tail_leg_times(best_route_stops)
+
     # Cache the result
     if use_cache:
-        _tsp_cache[cache_key] = (best_route_stops, best_dist)
-    
-    return best_route_stops, best_dist
+        _tsp_cache[cache_key] = (best_route_stops, best_dist, tail_leg_times)
+        if config.TSP_INSERTION_WARM_START:
+            _warm_tour_cache[(order_mask, picked_up_mask)] = best_route_stops
+
+    return best_route_stops, best_dist, tail_leg_times
+
+
+def _assign_bundle(driver: Driver, bundle: Bundle, current_time) -> None:
+    """
+    Hot-path bundle assignment (module-level to avoid bound-method dispatch).
+
+    Updates driver state:
+    - Sets assigned orders
+    - Updates route and stop index
+    - Calculates arrival time at first stop
+    - Marks orders as ASSIGNED
+    """
+    # Update driver's orders (replace to avoid duplicates)
+    driver.assigned_orders = list(bundle.orders)
+    driver.status = DriverStatus.ACCRUING
+    driver.route = bundle.route_sequence
+    driver.current_stop_index = 0
+
+    # Calculate arrival at first stop using road travel time
+    first_stop = driver.route[0]
+    travel_time = utils.get_travel_time(
+        driver.current_loc[0], driver.current_loc[1],
+        first_stop.location[0], first_stop.location[1]
+    )
+    driver.arrival_time_at_next_stop = utils.add_minutes_to_time(current_time, travel_time)
+    driver.arrival_min = minutes_of_day(driver.arrival_time_at_next_stop)
+
+    # Resolve every leg of the route now, while the distance cache is hot;
+    # the simulation tick loop then just indexes route_leg_mins
+    leg_mins = [travel_time]
+    route = driver.route
+    for k in range(1, len(route)):
+        prev_loc = route[k - 1].location
+        next_loc = route[k].location
+        leg_mins.append(utils.get_travel_time(
+            prev_loc[0], prev_loc[1], next_loc[0], next_loc[1]
+        ))
+    driver.route_leg_mins = tuple(leg_mins)
+
+    # Last pickup position drives the ACCRUING -> DELIVERING transition;
+    # computed once here so the tick loop never scans the route suffix
+    last_pickup = -1
+    for k, stop in enumerate(route):
+        if stop.stop_type_code == STOP_PICKUP:
+            last_pickup = k
+    driver.last_pickup_index = last_pickup
+
+    # Mark all orders as assigned
+    for order in bundle.orders:
+        order.status = OrderStatus.ASSIGNED
 
 
 class DispatchEngine:
@@ -415,50 +1099,44 @@ class DispatchEngine:
         combinatorial: Bidding on optimized order bundles 
     """
 
+    # Shared worker pool for parallel bundle bidding (created on first use)
+    _bid_pool: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _bid_executor(cls) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for parallel bundle bidding."""
+        if cls._bid_pool is None:
+            cls._bid_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="dispatch-bid",
+            )
+        return cls._bid_pool
+
     def _assign_bundle_to_driver(
-        self, 
-        driver: Driver, 
-        bundle: Bundle, 
+        self,
+        driver: Driver,
+        bundle: Bundle,
         current_time
     ) -> None:
         """
         Assign a bundle of orders to a driver.
-        
-        Updates driver state:
-        - Sets assigned orders
-        - Updates route and stop index
-        - Calculates arrival time at first stop
-        - Marks orders as ASSIGNED
-        
+
+        Thin wrapper over module-level `_assign_bundle` for non-hot callers;
+        the dispatch loops call `_assign_bundle` directly.
+
         Args:
             driver: The driver receiving the assignment
             bundle: The bundle of orders being assigned
             current_time: Current simulation time
         """
-        # Update driver's orders (replace to avoid duplicates)
-        driver.assigned_orders = list(bundle.orders)
-        driver.status = DriverStatus.ACCRUING
-        driver.route = bundle.route_sequence
-        driver.current_stop_index = 0
-
-        # Calculate arrival at first stop using road travel time
-        first_stop = driver.route[0]
-        travel_time = utils.get_travel_time(
-            driver.current_loc[0], driver.current_loc[1],
-            first_stop.location[0], first_stop.location[1]
-        )
-        driver.arrival_time_at_next_stop = utils.add_minutes_to_time(current_time, travel_time)
-        
-        # Mark all orders as assigned
-        for order in bundle.orders:
-            order.status = OrderStatus.ASSIGNED
+        _assign_bundle(driver, bundle, current_time)
 
     def run_baseline(
         self, 
         drivers: List[Driver], 
         orders: List[Order], 
         current_time
-    ) -> Tuple[List[Order], float]:
+    ) -> Tuple[List[Order], float, List[Driver]]:
         """
         Baseline greedy dispatch: assign each order to nearest idle driver.
         
@@ -473,34 +1151,37 @@ class DispatchEngine:
             current_time: Current simulation time
             
         Returns:
-            Tuple of (assigned_orders, total_distance_km)
+            Tuple of (assigned_orders, total_distance_km, newly_activated_drivers)
         """
         assigned_orders: List[Order] = []
         total_distance_in_tick: float = 0.0
-        
-        # Only consider idle, available drivers
+        activated_drivers: List[Driver] = []
+
+        # Only consider idle, available drivers (minute-twin compare,
+        # see Driver.available_min)
+        now_min = minutes_of_day(current_time)
         idle_drivers = [
-            d for d in drivers 
-            if d.status == DriverStatus.IDLE and d.available_from <= current_time
+            d for d in drivers
+            if d.status == DriverStatus.IDLE and d.available_min <= now_min
         ]
-        
-        for order in orders:
-            if not idle_drivers:
+        if not idle_drivers or not orders:
+            return assigned_orders, total_distance_in_tick, activated_drivers
+
+        # Driver positions are fixed within a tick, so all driver-to-pickup
+        # distances come from one vectorized pass instead of a per-order scan
+        pickup_dists = _driver_pickup_matrix(idle_drivers, orders)
+        idle_idx: List[int] = list(range(len(idle_drivers)))
+
+        for j, order in enumerate(orders):
+            if not idle_idx:
                 break  # No available drivers
 
-            # Find nearest driver
-            best_driver: Optional[Driver] = None
-            min_dist_to_pickup: float = float('inf')
+            # Find nearest driver among the remaining idle rows
+            col = pickup_dists[idle_idx, j]
+            k = int(col.argmin())
+            best_driver: Optional[Driver] = idle_drivers[idle_idx[k]]
+            min_dist_to_pickup: float = float(col[k])
 
-            for driver in idle_drivers:
-                dist = utils.get_distance(
-                    driver.current_loc[0], driver.current_loc[1],
-                    order.pickup_loc[0], order.pickup_loc[1]
-                )
-                if dist < min_dist_to_pickup:
-                    min_dist_to_pickup = dist
-                    best_driver = driver
-            
             if best_driver is not None:
                 # Create simple P1 -> D1 route
                 pickup_stop = Stop(
@@ -527,20 +1208,21 @@ class DispatchEngine:
                     total_distance=full_route_dist
                 )
                 
-                self._assign_bundle_to_driver(best_driver, bundle, current_time)
-                
+                _assign_bundle(best_driver, bundle, current_time)
+                activated_drivers.append(best_driver)
+
                 assigned_orders.append(order)
                 total_distance_in_tick += full_route_dist
-                idle_drivers.remove(best_driver)
+                idle_idx.pop(k)
 
-        return assigned_orders, total_distance_in_tick
+        return assigned_orders, total_distance_in_tick, activated_drivers
 
     def run_sequential(
         self, 
         drivers: List[Driver], 
         new_orders: List[Order], 
         current_time
-    ) -> Tuple[List[Order], float]:
+    ) -> Tuple[List[Order], float, List[Driver]]:
         """
         Sequential market-based dispatch with MARGINAL COST bidding.
         
@@ -561,32 +1243,40 @@ class DispatchEngine:
             current_time: Current simulation time
             
         Returns:
-            Tuple of (assigned_orders, total_marginal_distance_km)
+            Tuple of (assigned_orders, total_marginal_distance_km,
+            newly_activated_drivers)
         """
         # Clear TSP cache at start of dispatch cycle (fresh state)
         _clear_tsp_cache()
-        
+        _publish_cycle_travel_times(drivers, new_orders)
+
         assigned_orders: List[Order] = []
         total_distance_in_tick: float = 0.0
-        
-        # Track existing route distances for marginal cost calculation
+        activated_drivers: List[Driver] = []
+
+        # Track existing route distances for marginal cost calculation.
+        # The picked-up lists are hoisted here too: dispatch only ever adds
+        # ASSIGNED orders, so they stay valid for the whole cycle.
         driver_existing_distances: Dict[str, float] = {}
+        picked_by_driver: Dict[str, List[Order]] = {}
         for driver in drivers:
+            already_picked_up = [o for o in driver.assigned_orders if o.status == OrderStatus.PICKED_UP]
+            picked_by_driver[driver.driver_id] = already_picked_up
             if driver.status != DriverStatus.IDLE and driver.assigned_orders:
-                already_picked_up = [o for o in driver.assigned_orders if o.status == OrderStatus.PICKED_UP]
-                _, existing_dist = find_optimal_route(driver.current_loc, driver.assigned_orders, already_picked_up)
+                _, existing_dist, _ = find_optimal_route(driver.current_loc, driver.assigned_orders, already_picked_up)
                 driver_existing_distances[driver.driver_id] = existing_dist
             else:
                 driver_existing_distances[driver.driver_id] = 0.0
-        
+
         # Build eligible driver list
+        now_min = minutes_of_day(current_time)
         eligible_drivers: List[Driver] = []
         for d in drivers:
             if d.status == DriverStatus.DELIVERING:
                 continue  # Locked route
-            
+
             if d.status == DriverStatus.IDLE:
-                if d.available_from <= current_time:
+                if d.available_min <= now_min:
                     eligible_drivers.append(d)
             elif d.status == DriverStatus.ACCRUING:
                 if len(d.assigned_orders) < d.capacity:
@@ -604,23 +1294,20 @@ class DispatchEngine:
                 if len(potential_orders) > driver.capacity:
                     continue
 
-                # Determine already picked up orders
-                already_picked_up = [
-                    o for o in driver.assigned_orders 
-                    if o.status == OrderStatus.PICKED_UP
-                ]
-                
                 # Calculate optimal route from current location
-                route_sequence, total_distance = find_optimal_route(
-                    driver.current_loc, potential_orders, already_picked_up
+                route_sequence, total_distance, tail_legs = find_optimal_route(
+                    driver.current_loc, potential_orders, picked_by_driver[driver.driver_id]
                 )
                 if not route_sequence:
                     continue
 
+                leg_times = tail_legs.copy()
+                leg_times[0] = scoring.leg_time(driver.current_loc, route_sequence[0].location)
                 new_bundle = Bundle(
-                    orders=potential_orders, 
-                    route_sequence=route_sequence, 
-                    total_distance=total_distance
+                    orders=potential_orders,
+                    route_sequence=route_sequence,
+                    total_distance=total_distance,
+                    leg_times=leg_times
                 )
                 
                 # Pass existing route distance for MARGINAL cost calculation
@@ -636,9 +1323,11 @@ class DispatchEngine:
             
             if best_driver_for_order and best_bundle_for_order:
                 driver = best_driver_for_order
-                
-                self._assign_bundle_to_driver(driver, best_bundle_for_order, current_time)
-                
+
+                if driver.status == DriverStatus.IDLE:
+                    activated_drivers.append(driver)
+                _assign_bundle(driver, best_bundle_for_order, current_time)
+
                 order.status = OrderStatus.ASSIGNED
                 assigned_orders.append(order)
                 
@@ -655,17 +1344,10 @@ class DispatchEngine:
                 # assign to nearest IDLE driver anyway (better late than never)
                 idle_drivers = [d for d in eligible_drivers if d.status == DriverStatus.IDLE]
                 if idle_drivers:
-                    best_fallback_driver: Optional[Driver] = None
-                    min_dist: float = float('inf')
-                    for driver in idle_drivers:
-                        dist = utils.get_distance(
-                            driver.current_loc[0], driver.current_loc[1],
-                            order.pickup_loc[0], order.pickup_loc[1]
-                        )
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_fallback_driver = driver
-                    
+                    # Grid-accelerated nearest-driver query for this order
+                    k, min_dist = _nearest_driver(idle_drivers, order)
+                    best_fallback_driver: Optional[Driver] = idle_drivers[k]
+
                     if best_fallback_driver:
                         pickup_stop = Stop(location=order.pickup_loc, stop_type='PICKUP', order_id=order.order_id)
                         dropoff_stop = Stop(location=order.dropoff_loc, stop_type='DROPOFF', order_id=order.order_id)
@@ -678,25 +1360,26 @@ class DispatchEngine:
                         full_route_dist = min_dist + dist_pickup_to_dropoff
                         
                         bundle = Bundle(orders=[order], route_sequence=route, total_distance=full_route_dist)
-                        self._assign_bundle_to_driver(best_fallback_driver, bundle, current_time)
-                        
+                        _assign_bundle(best_fallback_driver, bundle, current_time)
+                        activated_drivers.append(best_fallback_driver)
+
                         order.status = OrderStatus.ASSIGNED
                         assigned_orders.append(order)
                         total_distance_in_tick += full_route_dist
                         driver_existing_distances[best_fallback_driver.driver_id] = full_route_dist
-                        
+
                         if len(best_fallback_driver.assigned_orders) >= best_fallback_driver.capacity:
                             if best_fallback_driver in eligible_drivers:
                                 eligible_drivers.remove(best_fallback_driver)
 
-        return assigned_orders, total_distance_in_tick
+        return assigned_orders, total_distance_in_tick, activated_drivers
 
     def run_combinatorial(
         self, 
         drivers: List[Driver], 
         orders: List[Order], 
         current_time
-    ) -> Tuple[List[Order], float]:
+    ) -> Tuple[List[Order], float, List[Driver]]:
         """
         Combinatorial dispatch using spatial clustering for bundle generation.
         
@@ -713,40 +1396,61 @@ class DispatchEngine:
             current_time: Current simulation time
             
         Returns:
-            Tuple of (assigned_orders, total_marginal_distance_km)
+            Tuple of (assigned_orders, total_marginal_distance_km,
+            newly_activated_drivers)
         """
         # Clear TSP cache at start of dispatch cycle (fresh state)
         _clear_tsp_cache()
-        
+        _publish_cycle_travel_times(drivers, orders)
+
         assigned_orders_in_cycle: List[Order] = []
         total_distance_in_tick: float = 0.0
-        
-        # Track existing route distances for marginal cost calculation
+        activated_drivers: List[Driver] = []
+
+        # Track existing route distances for marginal cost calculation.
+        # The picked-up lists are hoisted here too: dispatch only ever adds
+        # ASSIGNED orders, so they stay valid for the whole cycle.
         driver_existing_distances: Dict[str, float] = {}
+        picked_by_driver: Dict[str, List[Order]] = {}
         for driver in drivers:
+            already_picked_up = [o for o in driver.assigned_orders if o.status == OrderStatus.PICKED_UP]
+            picked_by_driver[driver.driver_id] = already_picked_up
             if driver.status != DriverStatus.IDLE and driver.assigned_orders:
-                already_picked_up = [o for o in driver.assigned_orders if o.status == OrderStatus.PICKED_UP]
-                _, existing_dist = find_optimal_route(driver.current_loc, driver.assigned_orders, already_picked_up)
+                _, existing_dist, _ = find_optimal_route(driver.current_loc, driver.assigned_orders, already_picked_up)
                 driver_existing_distances[driver.driver_id] = existing_dist
             else:
                 driver_existing_distances[driver.driver_id] = 0.0
-        
+
         # Build eligible driver list
+        now_min = minutes_of_day(current_time)
         eligible_drivers: List[Driver] = []
         for d in drivers:
             if d.status == DriverStatus.DELIVERING:
                 continue
             if d.status == DriverStatus.IDLE:
-                if d.available_from <= current_time:
+                if d.available_min <= now_min:
                     eligible_drivers.append(d)
             elif d.status == DriverStatus.ACCRUING:
                 if len(d.assigned_orders) < d.capacity:
                     eligible_drivers.append(d)
-        
+
         pending_orders = list(orders)
         
         # Build distance matrix ONCE for all pending orders (optimization)
-        all_order_distances = _build_distance_matrix(pending_orders) if pending_orders else {}
+        all_order_distances = _build_distance_matrix(pending_orders) if pending_orders else None
+
+        # Publish the pickup matrix so route solves can reuse its block
+        global _cycle_pickup_distances
+        _cycle_pickup_distances = all_order_distances
+
+        # Register cache-key bits up front so bidding threads only read the map
+        for order in pending_orders:
+            if order.order_id not in _order_bit:
+                _order_bit[order.order_id] = 1 << len(_order_bit)
+        for driver in eligible_drivers:
+            for order in driver.assigned_orders:
+                if order.order_id not in _order_bit:
+                    _order_bit[order.order_id] = 1 << len(_order_bit)
 
         while eligible_drivers and pending_orders:
             # Generate bundles using spatial clustering (pass prebuilt distances)
@@ -756,87 +1460,133 @@ class DispatchEngine:
                 prebuilt_distances=all_order_distances
             )
             
-            # Collect all possible (cost, driver, bundle, new_orders, marginal_dist) tuples
-            all_possible_assignments: List[Tuple[float, Driver, Bundle, List[Order], float]] = []
-
-            for order_combo in candidate_bundles:
-                # Have each eligible driver bid on this bundle
-                for driver in eligible_drivers:
-                    # Check capacity
-                    total_orders = len(driver.assigned_orders) + len(order_combo)
-                    if total_orders > driver.capacity:
-                        continue
+            # Dense (bundle, driver) bid matrix; capacity/route/time rejections
+            # stay at inf so selection is a single argmin over the matrix
+            n_bundles = len(candidate_bundles)
+            n_drivers = len(eligible_drivers)
+            bid_matrix = np.full((n_bundles, n_drivers), np.inf)
+            bids: Dict[Tuple[int, int], Tuple[Bundle, float]] = {}
 
-                    # Combine existing and new orders
-                    all_orders = driver.assigned_orders + list(order_combo)
-                    
-                    # Handle already picked up orders
-                    already_picked_up = [
-                        o for o in driver.assigned_orders 
-                        if o.status == OrderStatus.PICKED_UP
-                    ]
-
-                    route_sequence, total_distance = find_optimal_route(
-                        driver.current_loc, all_orders, already_picked_up
+            # Vectorized feasibility pre-filter: a bid can only be finite if
+            # every new order could still meet the hard delivery limit via
+            # the cheapest conceivable route (straight to its pickup, then
+            # straight to its dropoff). That lower bound never exceeds the
+            # true route duration, so pruned pairs are exactly the ones the
+            # full scoring call would have rejected anyway. Skipped in road
+            # mode where straight-line times do not bound OSRM legs cleanly.
+            feasible_pair: Optional[np.ndarray] = None
+            if not config.USE_ROAD_DISTANCE and n_bundles and n_drivers:
+                drv_time = _driver_pickup_matrix(eligible_drivers, pending_orders)
+                drv_time = (drv_time / config.AVG_SPEED_KMH) * 60
+                pd_time = np.fromiter(
+                    (
+                        (utils.haversine_distance(o.pickup_lat, o.pickup_lng, o.dropoff_lat, o.dropoff_lng)
+                         / config.AVG_SPEED_KMH) * 60
+                        for o in pending_orders
+                    ),
+                    dtype=np.float64, count=len(pending_orders),
+                )
+                age = now_min - np.fromiter((o.created_min for o in pending_orders), dtype=np.float64, count=len(pending_orders))
+                # (driver, order) lower bound on delivery duration
+                order_ok = (
+                    age[None, :] + drv_time + pd_time[None, :] + 2 * config.SERVICE_TIME_MINS
+                    <= config.MAX_DELIVERY_TIME_MINS
+                )
+                cap_left = np.fromiter(
+                    (d.capacity - len(d.assigned_orders) for d in eligible_drivers),
+                    dtype=np.int64, count=n_drivers,
+                )
+                pending_idx = {o.order_id: j for j, o in enumerate(pending_orders)}
+                feasible_pair = np.empty((n_bundles, n_drivers), dtype=np.bool_)
+                for bi, combo in enumerate(candidate_bundles):
+                    cols = [pending_idx[o.order_id] for o in combo]
+                    feasible_pair[bi] = (cap_left >= len(combo)) & order_ok[:, cols].all(axis=1)
+
+            def _bid_row(bi: int) -> None:
+                """Collect every eligible driver's bid on one bundle row."""
+                order_combo = candidate_bundles[bi]
+                row_ok = feasible_pair[bi] if feasible_pair is not None else None
+                row_cols: List[int] = []
+                row_entries: List[Tuple[Driver, Bundle, float]] = []
+                for di, driver in enumerate(eligible_drivers):
+                    if row_ok is not None:
+                        if not row_ok[di]:
+                            continue
+                    else:
+                        # Check capacity
+                        total_orders = len(driver.assigned_orders) + len(order_combo)
+                        if total_orders > driver.capacity:
+                            continue
+
+                    # Combine existing and new orders (single list build, no
+                    # intermediate copy of the combo tuple)
+                    all_orders = [*driver.assigned_orders, *order_combo]
+
+                    route_sequence, total_distance, tail_legs = find_optimal_route(
+                        driver.current_loc, all_orders, picked_by_driver[driver.driver_id]
                     )
                     if not route_sequence:
                         continue
 
+                    leg_times = tail_legs.copy()
+                    leg_times[0] = scoring.leg_time(driver.current_loc, route_sequence[0].location)
                     bundle = Bundle(
-                        orders=all_orders, 
-                        route_sequence=route_sequence, 
-                        total_distance=total_distance
+                        orders=all_orders,
+                        route_sequence=route_sequence,
+                        total_distance=total_distance,
+                        leg_times=leg_times
                     )
-                    
-                    # Pass existing route distance for MARGINAL cost calculation
+
+                    # Existing route distance enables MARGINAL cost calculation
                     existing_dist = driver_existing_distances.get(driver.driver_id, 0.0)
-                    cost = scoring.calculate_trip_cost(driver, bundle, current_time, existing_dist)
-                    marginal_distance = total_distance - existing_dist
-                    
+                    row_cols.append(di)
+                    row_entries.append((driver, bundle, existing_dist))
+
+                if not row_entries:
+                    return
+
+                # Score the whole row in one batched kernel call
+                costs = scoring.calculate_trip_costs(row_entries, current_time)
+                for col, (_, bundle, existing_dist), cost in zip(row_cols, row_entries, costs):
                     if cost != float('inf'):
-                        all_possible_assignments.append(
-                            (cost, driver, bundle, list(order_combo), marginal_distance)
-                        )
+                        bid_matrix[bi, col] = cost
+                        bids[(bi, col)] = (bundle, bundle.total_distance - existing_dist)
+
+            # Spread bundle rows across threads when there is enough work to
+            # amortize pool overhead; the route kernel drops the GIL (nogil),
+            # and every cell/cache write is deterministic, so the filled
+            # matrix is identical either way
+            if _HAVE_NUMBA and n_bundles * n_drivers >= 256:
+                for _ in self._bid_executor().map(_bid_row, range(n_bundles)):
+                    pass
+            else:
+                for bi in range(n_bundles):
+                    _bid_row(bi)
 
-            if not all_possible_assignments:
+            if not bids:
                 # FALLBACK: Assign remaining orders to ANY eligible driver
                 # This handles cases where time constraint rejects all bundles
-                orders_assigned_in_fallback: List[Order] = []
-                
-                for order in pending_orders[:]:
+                assigned_ids: Set[str] = set()
+
+                for order in pending_orders:
                     if not eligible_drivers:
                         break
                     
                     best_fallback_driver: Optional[Driver] = None
                     min_dist: float = float('inf')
-                    
-                    # First try IDLE drivers
-                    idle_drivers = [d for d in eligible_drivers if d.status == DriverStatus.IDLE]
-                    for driver in idle_drivers:
-                        if len(driver.assigned_orders) >= driver.capacity:
-                            continue
-                        dist = utils.get_distance(
-                            driver.current_loc[0], driver.current_loc[1],
-                            order.pickup_loc[0], order.pickup_loc[1]
-                        )
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_fallback_driver = driver
-                    
-                    # If no IDLE driver, try ACCRUING drivers
-                    if not best_fallback_driver:
-                        accruing_drivers = [d for d in eligible_drivers if d.status == DriverStatus.ACCRUING]
-                        for driver in accruing_drivers:
-                            if len(driver.assigned_orders) >= driver.capacity:
-                                continue
-                            dist = utils.get_distance(
-                                driver.current_loc[0], driver.current_loc[1],
-                                order.pickup_loc[0], order.pickup_loc[1]
-                            )
-                            if dist < min_dist:
-                                min_dist = dist
-                                best_fallback_driver = driver
-                    
+
+                    # Try IDLE drivers first, then ACCRUING; each query is
+                    # grid-accelerated on large fleets
+                    for status in (DriverStatus.IDLE, DriverStatus.ACCRUING):
+                        candidates = [
+                            d for d in eligible_drivers
+                            if d.status == status and len(d.assigned_orders) < d.capacity
+                        ]
+                        if candidates:
+                            k, min_dist = _nearest_driver(candidates, order)
+                            best_fallback_driver = candidates[k]
+                            break
+
                     if best_fallback_driver:
                         if best_fallback_driver.status == DriverStatus.IDLE:
                             # Create simple P->D route
@@ -851,15 +1601,16 @@ class DispatchEngine:
                             full_route_dist = min_dist + dist_pickup_to_dropoff
                             
                             bundle = Bundle(orders=[order], route_sequence=route, total_distance=full_route_dist)
-                            self._assign_bundle_to_driver(best_fallback_driver, bundle, current_time)
+                            _assign_bundle(best_fallback_driver, bundle, current_time)
+                            activated_drivers.append(best_fallback_driver)
                             total_distance_in_tick += full_route_dist
                         else:
                             # For ACCRUING drivers, add order to their existing route
                             all_orders = best_fallback_driver.assigned_orders + [order]
-                            already_picked_up = [o for o in best_fallback_driver.assigned_orders if o.status == OrderStatus.PICKED_UP]
-                            
-                            route_sequence, total_distance = find_optimal_route(
-                                best_fallback_driver.current_loc, all_orders, already_picked_up
+
+                            route_sequence, total_distance, _ = find_optimal_route(
+                                best_fallback_driver.current_loc, all_orders,
+                                picked_by_driver[best_fallback_driver.driver_id]
                             )
                             
                             if route_sequence:
@@ -867,7 +1618,7 @@ class DispatchEngine:
                                 marginal_dist = total_distance - existing_dist
                                 
                                 bundle = Bundle(orders=all_orders, route_sequence=route_sequence, total_distance=total_distance)
-                                self._assign_bundle_to_driver(best_fallback_driver, bundle, current_time)
+                                _assign_bundle(best_fallback_driver, bundle, current_time)
                                 total_distance_in_tick += marginal_dist
                                 driver_existing_distances[best_fallback_driver.driver_id] = total_distance
                             else:
@@ -875,45 +1626,62 @@ class DispatchEngine:
                         
                         order.status = OrderStatus.ASSIGNED
                         assigned_orders_in_cycle.append(order)
-                        orders_assigned_in_fallback.append(order)
-                        
-                        if len(best_fallback_driver.assigned_orders) >= best_fallback_driver.capacity:
-                            if best_fallback_driver in eligible_drivers:
-                                eligible_drivers.remove(best_fallback_driver)
-                
-                # Remove assigned orders from pending
-                for order in orders_assigned_in_fallback:
-                    if order in pending_orders:
-                        pending_orders.remove(order)
-                
-                if not orders_assigned_in_fallback:
+                        assigned_ids.add(order.order_id)
+
+                # Rebuild pending/eligible lists in one pass each instead of
+                # O(n) remove() calls inside the loop. The candidate filter
+                # above already skips at-capacity drivers mid-loop.
+                pending_orders = [o for o in pending_orders if o.order_id not in assigned_ids]
+                eligible_drivers = [
+                    d for d in eligible_drivers if len(d.assigned_orders) < d.capacity
+                ]
+
+                if not assigned_ids:
                     break
                 else:
                     continue
 
             # GREEDY SELECTION with BUNDLE SIZE TIE-BREAKER
-            # Primary: lowest cost per order
-            # Secondary: prefer LARGER bundles (reduces drivers needed)
-            best_cost, best_driver, best_bundle, new_orders_in_bundle, marginal_dist = min(
-                all_possible_assignments, 
-                key=lambda x: (x[0], -len(x[3]))  # (cost, -bundle_size)
+            # Primary: lowest cost per order, quantized to 0.01 km-equivalent.
+            # Only the ordering matters here, and quantizing keeps float noise
+            # (e.g. from rounded cache keys) from flipping near-ties.
+            # Secondary: prefer LARGER bundles (reduces drivers needed).
+            # Both are folded into one integer key so the winner is a single
+            # argmin over the dense matrix.
+            bundle_sizes = np.fromiter(
+                (len(c) for c in candidate_bundles), dtype=np.int64, count=n_bundles
+            )
+            size_base = config.MAX_BUNDLE_SIZE + 1
+            finite = np.isfinite(bid_matrix)
+            sel_key = np.full(bid_matrix.shape, np.iinfo(np.int64).max, dtype=np.int64)
+            size_grid = np.broadcast_to(bundle_sizes[:, None], bid_matrix.shape)
+            sel_key[finite] = (
+                np.floor(bid_matrix[finite] * 100).astype(np.int64) * size_base
+                + (size_base - 1 - size_grid[finite])
             )
 
-            self._assign_bundle_to_driver(best_driver, best_bundle, current_time)
-            
+            best_bi, best_di = divmod(int(sel_key.argmin()), n_drivers)
+            best_driver = eligible_drivers[best_di]
+            best_bundle, marginal_dist = bids[(best_bi, best_di)]
+            new_orders_in_bundle = candidate_bundles[best_bi]
+
+            if best_driver.status == DriverStatus.IDLE:
+                activated_drivers.append(best_driver)
+            _assign_bundle(best_driver, best_bundle, current_time)
+
             # Track only marginal distance added
             total_distance_in_tick += marginal_dist
             driver_existing_distances[best_driver.driver_id] = best_bundle.total_distance
 
-            # Remove assigned orders from pending
-            for order in new_orders_in_bundle:
-                assigned_orders_in_cycle.append(order)
-                if order in pending_orders:
-                    pending_orders.remove(order)
-            
+            # Remove assigned orders from pending (single-pass rebuild)
+            assigned_orders_in_cycle.extend(new_orders_in_bundle)
+            bundle_ids = {o.order_id for o in new_orders_in_bundle}
+            pending_orders = [o for o in pending_orders if o.order_id not in bundle_ids]
+
             # Remove driver if at capacity
             if len(best_driver.assigned_orders) >= best_driver.capacity:
-                if best_driver in eligible_drivers:
-                    eligible_drivers.remove(best_driver)
+                eligible_drivers = [
+                    d for d in eligible_drivers if len(d.assigned_orders) < d.capacity
+                ]
         
-        return assigned_orders_in_cycle, total_distance_in_tick
+        return assigned_orders_in_cycle, total_distance_in_tick, activated_drivers
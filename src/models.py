@@ -13,38 +13,93 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import time
-from enum import Enum
-from typing import List, Tuple, Optional
+from enum import IntEnum
+from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 
-class OrderStatus(Enum):
-    """Lifecycle states for an order in the delivery system."""
-    PENDING = "PENDING"      # Order created, awaiting assignment
-    ASSIGNED = "ASSIGNED"    # Assigned to a driver, not yet picked up
-    PICKED_UP = "PICKED_UP"  # Driver has collected the order
-    DELIVERED = "DELIVERED"  # Successfully delivered to customer
-    FAILED = "FAILED"        # Delivery failed (timeout, etc.)
+from . import config
 
 
-class DriverStatus(Enum):
+class VehicleType(IntEnum):
+    """
+    Vehicle types, int-coded like the status enums so hot paths index a
+    fixed penalty table instead of hashing strings.
+    """
+    MOTORBIKE = 0
+    BIKE = 1
+    CAR = 2
+
+
+# Penalty multipliers indexed by VehicleType code (resolved once per Driver
+# in __post_init__); the string-keyed dict remains for the public
+# get_vehicle_penalty helper in scoring.
+_VEHICLE_PENALTY_TABLE: Tuple[float, ...] = (
+    config.PENALTY_MOTORBIKE,
+    config.PENALTY_BIKE,
+    config.PENALTY_CAR,
+)
+
+VEHICLE_PENALTIES: Dict[str, float] = {
+    "motorbike": config.PENALTY_MOTORBIKE,
+    "bike": config.PENALTY_BIKE,
+    "car": config.PENALTY_CAR,
+}
+
+_VEHICLE_TYPE_CODES: Dict[str, int] = {
+    "motorbike": VehicleType.MOTORBIKE,
+    "bike": VehicleType.BIKE,
+    "car": VehicleType.CAR,
+}
+
+
+class OrderStatus(IntEnum):
+    """
+    Lifecycle states for an order in the delivery system.
+
+    Backed by small ints so status writes and comparisons in the dispatch
+    hot loops are plain integer operations. Use `.name` for display.
+    """
+    PENDING = 0    # Order created, awaiting assignment
+    ASSIGNED = 1   # Assigned to a driver, not yet picked up
+    PICKED_UP = 2  # Driver has collected the order
+    DELIVERED = 3  # Successfully delivered to customer
+    FAILED = 4     # Delivery failed (timeout, etc.)
+
+
+class DriverStatus(IntEnum):
     """
     States for a driver in the Market-Based Task Allocation system.
-    
+
     The driver state machine:
     - IDLE: Available and can bid on new orders
     - ACCRUING: Has orders assigned, still picking up. Can accept more orders.
     - DELIVERING: All pickups complete, route is locked. Cannot accept new orders.
+
+    Backed by small ints (see OrderStatus). Use `.name` for display.
     """
-    IDLE = "IDLE"
-    ACCRUING = "ACCRUING"
-    DELIVERING = "DELIVERING"
+    IDLE = 0
+    ACCRUING = 1
+    DELIVERING = 2
+
+
+def minutes_of_day(t: time) -> float:
+    """Convert a time-of-day to float minutes since midnight."""
+    return t.hour * 60.0 + t.minute + t.second / 60.0 + t.microsecond / 60e6
 
 
-@dataclass
+# Integer codes for Stop.stop_type so hashing, equality and the hot-loop
+# comparisons all work on ints rather than strings
+STOP_PICKUP: int = 0
+STOP_DROPOFF: int = 1
+_STOP_TYPE_CODES: Dict[str, int] = {"PICKUP": STOP_PICKUP, "DROPOFF": STOP_DROPOFF}
+
+
+@dataclass(slots=True)
 class Stop:
     """
     Represents a single stop (pickup or dropoff) in a driver's route.
-    
+
     Attributes:
         location: (latitude, longitude) coordinates of the stop
         stop_type: Either 'PICKUP' or 'DROPOFF'
@@ -53,19 +108,34 @@ class Stop:
     location: Tuple[float, float]
     stop_type: str  # 'PICKUP' or 'DROPOFF'
     order_id: str
+    stop_type_code: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.stop_type_code = _STOP_TYPE_CODES.get(self.stop_type, -1)
+
+    def __eq__(self, other: object) -> bool:
+        # (stop_type, order_id) fully identifies a stop -- the location is
+        # derived from the order -- so skip the float tuple comparison
+        if not isinstance(other, Stop):
+            return NotImplemented
+        return self.stop_type_code == other.stop_type_code and self.order_id == other.order_id
 
     def __hash__(self) -> int:
-        return hash((self.location, self.stop_type, self.order_id))
+        return (self.stop_type_code << 1) ^ hash(self.order_id)
 
     def __repr__(self) -> str:
         return f"Stop({self.stop_type}:{self.order_id})"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Order:
     """
     Represents a delivery order from restaurant to customer.
-    
+
+    eq=False: orders are unique entities shared by reference, so identity
+    comparison is both correct and much cheaper than field-by-field __eq__
+    in membership tests (and makes instances hashable).
+
     Attributes:
         order_id: Unique identifier
         pickup_lat/lng: Restaurant location
@@ -86,11 +156,21 @@ class Order:
     deadline: time
     estimated_delivery_time_min: int
     status: OrderStatus = OrderStatus.PENDING
-    
+
     # Timestamps for KPI calculation
     pickup_time: Optional[time] = None
     dropoff_time: Optional[time] = None
 
+    # Float minutes-of-day twins of created_time/deadline, precomputed so
+    # the scoring hot path never converts `time` objects per stop
+    created_min: float = field(init=False, repr=False)
+    deadline_min: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute float minutes-of-day for the time fields."""
+        self.created_min = minutes_of_day(self.created_time)
+        self.deadline_min = minutes_of_day(self.deadline)
+
     @property
     def pickup_loc(self) -> Tuple[float, float]:
         """Returns the pickup location as a (lat, lng) tuple."""
@@ -102,14 +182,17 @@ class Order:
         return (self.dropoff_lat, self.dropoff_lng)
 
     def __repr__(self) -> str:
-        return f"Order({self.order_id}, {self.status.value})"
+        return f"Order({self.order_id}, {self.status.name})"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Driver:
     """
     Represents a courier/driver in the delivery fleet.
-    
+
+    eq=False for the same reason as Order: drivers are unique shared
+    entities, and identity equality keeps list membership checks cheap.
+
     Attributes:
         driver_id: Unique identifier
         start_lat/lng: Initial position when shift starts
@@ -139,15 +222,43 @@ class Driver:
     assigned_orders: List[Order] = field(default_factory=list)
 
     # Route management
-    route: List[Stop] = field(default_factory=list)
+    route: Tuple[Stop, ...] = ()
     current_stop_index: int = -1
     arrival_time_at_next_stop: Optional[time] = None
 
+    # Travel minutes into each stop (leg k = stop k-1 -> stop k; leg 0 is
+    # driver -> first stop at assignment). Precomputed by the dispatch
+    # engine so the tick loop never re-resolves travel times.
+    route_leg_mins: Tuple[float, ...] = ()
+
+    # Index of the last PICKUP stop in route (-1 if none); once the stop
+    # index passes it, only dropoffs remain and the route is locked
+    last_pickup_index: int = -1
+
+    # Vehicle type code and cost penalty, resolved once since vehicle_type
+    # is immutable -- avoids a string lower() + dict lookup per scoring call
+    vehicle_type_code: int = field(init=False, repr=False)
+    vehicle_penalty: float = field(init=False, repr=False)
+
+    # Float minutes-of-day twins of available_from/arrival_time_at_next_stop
+    # (same pattern as Order.created_min): availability and arrival checks
+    # run every tick and every dispatch round, and a float compare is much
+    # cheaper than time.__le__. arrival_min is updated in lockstep wherever
+    # arrival_time_at_next_stop is set.
+    available_min: float = field(init=False, repr=False)
+    arrival_min: float = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
         """Initialize dynamic position from starting position."""
         self.current_lat = self.start_lat
         self.current_lng = self.start_lng
         self.arrival_time_at_next_stop = self.available_from
+        self.available_min = minutes_of_day(self.available_from)
+        self.arrival_min = self.available_min
+        self.vehicle_type_code = _VEHICLE_TYPE_CODES.get(
+            self.vehicle_type.lower(), VehicleType.MOTORBIKE
+        )
+        self.vehicle_penalty = _VEHICLE_PENALTY_TABLE[self.vehicle_type_code]
     
     @property
     def current_loc(self) -> Tuple[float, float]:
@@ -155,26 +266,35 @@ class Driver:
         return (self.current_lat, self.current_lng)
 
     def __repr__(self) -> str:
-        return f"Driver({self.driver_id}, {self.status.value}, orders={len(self.assigned_orders)})"
+        return f"Driver({self.driver_id}, {self.status.name}, orders={len(self.assigned_orders)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Bundle:
     """
     Represents a potential job bundle for a driver.
-    
+
     In our Market-Based Task Allocation system, bundles are "contracts" that drivers bid on.
     A bundle contains one or more orders and a proposed route sequence.
-    
+
     Attributes:
         orders: List of orders in this bundle
         route_sequence: Optimized sequence of stops to complete all orders
         total_distance: Total travel distance for this route in km
+        leg_times: Optional per-stop travel minutes (leg k = arrival leg of
+            stop k, starting from the driver), precomputed by dispatch so
+            scoring can skip re-resolving them
     """
     orders: List[Order]
-    route_sequence: List[Stop]
+    route_sequence: Tuple[Stop, ...]
     total_distance: float = 0.0
-    
+    leg_times: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze the route into a tuple: compact, and safe to share with Driver.route."""
+        if not isinstance(self.route_sequence, tuple):
+            self.route_sequence = tuple(self.route_sequence)
+
     @property
     def num_orders(self) -> int:
         """Returns the number of orders in this bundle."""
@@ -20,13 +20,37 @@ This is the winning metric that shows how bundling reduces fleet size needs.
 from __future__ import annotations
 
 import csv
+import heapq
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, time
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 
+import numpy as np
+
+# Optional dependency: pandas accelerates CSV loading via its C parser and
+# vectorized datetime parsing. The stdlib csv path remains as fallback.
+try:
+    import pandas as pd
+    _HAVE_PANDAS = True
+except ImportError:
+    _HAVE_PANDAS = False
+
+# Optional dependency: numba fuses the KPI reductions into one pass over
+# the durations array. NumPy reductions remain as fallback.
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 from . import config, utils
-from .models import Order, Driver, OrderStatus, DriverStatus
+from .models import (
+    Order, Driver, OrderStatus, DriverStatus,
+    STOP_PICKUP, STOP_DROPOFF, minutes_of_day,
+)
 from .dispatch import DispatchEngine
 
 
@@ -64,6 +88,72 @@ class SimulationResults:
         }
 
 
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _kpi_reduce(durations: np.ndarray):
+        """
+        One fused pass over the delivery durations: sum, sum of squares,
+        min/max and the late/early bucket counts, instead of six separate
+        NumPy reductions each touching the whole array.
+        """
+        n = durations.shape[0]
+        total = 0.0
+        total_sq = 0.0
+        mn = durations[0]
+        mx = durations[0]
+        late30 = 0
+        late45 = 0
+        late60 = 0
+        early = 0
+        for i in range(n):
+            d = durations[i]
+            total += d
+            total_sq += d * d
+            if d < mn:
+                mn = d
+            if d > mx:
+                mx = d
+            if d > 60:
+                late60 += 1
+            if d > 45:
+                late45 += 1
+            if d > 30:
+                late30 += 1
+            if d < 15:
+                early += 1
+        mean = total / n
+        std = 0.0
+        if n > 1:
+            var = (total_sq - n * mean * mean) / (n - 1)
+            if var > 0.0:
+                std = var ** 0.5
+        return mean, std, mn, mx, late30, late45, late60, early
+
+
+def _deadline_time(created: time, minutes: int) -> time:
+    """
+    Whole-minute deadline for an order, wrapping at midnight.
+
+    Plain integer arithmetic instead of utils.add_minutes_to_time's
+    datetime.combine + timedelta round trip -- load_data calls this once
+    per order, so the object churn adds up on large datasets.
+    """
+    total_sec = (created.hour * 3600 + created.minute * 60 + created.second
+                 + minutes * 60) % 86400
+    return time(total_sec // 3600, (total_sec // 60) % 60, total_sec % 60)
+
+
+def _run_strategy(strategy: str, drivers: List[Driver], orders: List[Order]) -> Dict[str, Any]:
+    """
+    Worker for Simulation.run_many: one full simulation in a child process.
+
+    Module-level so it pickles by reference; the drivers/orders arguments
+    arrive as fresh copies via pickling, so no explicit deepcopy is needed.
+    """
+    return Simulation(drivers, orders).run(strategy, verbose=False)
+
+
 class Simulation:
     """
     Discrete-event simulation of last-mile delivery operations.
@@ -79,7 +169,7 @@ class Simulation:
         drivers: List of all drivers in the fleet
         orders_map: Quick lookup of orders by ID
         current_time: Current simulation time
-        completed_missions: List of completed deliveries (for KPI calculation)
+        _mission_duration_min: Preallocated per-delivery durations (for KPI calculation)
         drivers_activated: Set of driver IDs that handled at least one order
     """
     
@@ -89,39 +179,79 @@ class Simulation:
         
         Args:
             drivers: List of all available drivers
-            orders: List of all orders to be delivered
+            orders: List of all orders to be delivered, in creation-time
+                order (load_data returns them pre-sorted)
         """
         self.start_time: time = config.START_TIME
         self.end_time: time = config.SIMULATION_END_TIME
         self.current_time: time = self.start_time
 
-        # Sort orders by creation time for proper injection
-        self.master_orders_list: List[Order] = sorted(orders, key=lambda o: o.created_time)
+        # Float minutes-of-day twin of current_time, advanced in lockstep;
+        # dispatch decisions subtract floats instead of datetime.combine pairs
+        self._current_min: float = minutes_of_day(self.start_time)
+        # Twin of end_time so the run loop compares floats, not time objects
+        self._end_min: float = minutes_of_day(self.end_time)
+
+        # load_data returns orders already creation-time-ordered (sorted
+        # once there, so parallel strategy runs don't each re-sort the
+        # same input); a shallow copy suffices. The list is never
+        # mutated; _master_idx marks how far injection has advanced.
+        self.master_orders_list: List[Order] = list(orders)
+        self._master_idx: int = 0
         self.drivers: List[Driver] = drivers
         self.orders_map: Dict[str, Order] = {o.order_id: o for o in orders}
-        
-        self.pending_orders: List[Order] = []
-        self.completed_missions: List[Dict] = []
+
+        # Keyed by order_id so assigned orders are removed in O(1);
+        # insertion order (creation time) is preserved by the dict
+        self.pending_orders: Dict[str, Order] = {}
+
+        # Mission log as preallocated parallel arrays: every order is
+        # delivered at most once, so len(orders) bounds the log. Durations
+        # feed the vectorized KPI pass directly; the id lists exist only
+        # for diagnostics.
+        self._mission_duration_min: np.ndarray = np.empty(len(orders), dtype=np.float64)
+        self._mission_order_ids: List[str] = []
+        self._mission_driver_ids: List[str] = []
+        self._n_completed: int = 0
         
         # KPI Tracking
         self.total_distance_traveled: float = 0.0
         self.total_busy_driver_ticks: int = 0
         self.total_driver_ticks: int = 0
         self.drivers_activated: set = set()  # Driver IDs who handled orders
+
+        # Drivers currently executing a route. Dispatch activations add to
+        # this set and route completion removes, so the per-tick state
+        # update never scans the (mostly IDLE) full fleet.
+        self._active_drivers: set = set()
         
         # Route history for visualization
         self.driver_route_history: Dict[str, List[Tuple[float, float]]] = {}
 
         self.dispatch_engine = DispatchEngine()
-        self.recent_order_times: List[time] = []
-        
-        # Batching state
-        self.batch_start_time: Optional[time] = None
+        # Creation minute stamps, monotonically increasing; stale entries
+        # are dropped from the left in _get_dispatch_mode
+        self.recent_order_times: deque[float] = deque()
+
+        # Batching state (minute-of-day of the first order in the batch)
+        self.batch_start_min: Optional[float] = None
+
+        # Next minute-of-day at which verbose progress logging fires
+        # (every 10 simulated minutes); a threshold compare per tick
+        # instead of a modulo on time.minute
+        self._next_log_min: float = self._current_min - self._current_min % 10
+        if self._current_min % 10:
+            self._next_log_min += 10
+
+        # Min-heap of (urgency trigger minute, order_id) for pending orders;
+        # entries for assigned orders are discarded lazily when popped
+        self._pending_by_deadline: List[Tuple[float, str]] = []
         
         # Precompute road distances for all locations (much faster than individual calls)
         self._precompute_distances(drivers, orders)
 
-    def _precompute_distances(self, drivers: List[Driver], orders: List[Order]) -> None:
+    @staticmethod
+    def _precompute_distances(drivers: List[Driver], orders: List[Order]) -> None:
         """
         Precompute all pairwise distances using OSRM Table API.
         
@@ -164,8 +294,10 @@ class Simulation:
             courier_file: Path to couriers CSV
             
         Returns:
-            Tuple of (drivers, orders) lists
-            
+            Tuple of (drivers, orders) lists; orders are sorted by
+            creation time so every Simulation built from them skips
+            its own sort
+
         Raises:
             FileNotFoundError: If files don't exist
             ValueError: If file format is invalid
@@ -175,61 +307,137 @@ class Simulation:
             raise FileNotFoundError(f"Order file not found: {order_file}")
         if not os.path.exists(courier_file):
             raise FileNotFoundError(f"Courier file not found: {courier_file}")
-        
+
+        if _HAVE_PANDAS:
+            return (
+                Simulation._load_drivers_pandas(courier_file),
+                Simulation._load_orders_pandas(order_file),
+            )
+
         orders: List[Order] = []
         with open(order_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    # Handle both datetime and time-only formats
-                    created_time_str = row['created_time']
-                    if ' ' in created_time_str:
-                        # Full datetime format: '2025-01-15 18:07:14'
-                        created_time = datetime.strptime(created_time_str, '%Y-%m-%d %H:%M:%S').time()
-                    else:
-                        # Time-only format: '18:07:14'
-                        created_time = datetime.strptime(created_time_str, '%H:%M:%S').time()
-                    estimated_time = int(row['estimated_delivery_time_min'])
-                    deadline = utils.add_minutes_to_time(created_time, estimated_time)
-                    orders.append(Order(
-                        order_id=row['order_id'],
-                        pickup_lat=float(row['pickup_lat']),
-                        pickup_lng=float(row['pickup_lng']),
-                        dropoff_lat=float(row['dropoff_lat']),
-                        dropoff_lng=float(row['dropoff_lng']),
-                        created_time=created_time,
-                        deadline=deadline,
-                        estimated_delivery_time_min=estimated_time
-                    ))
-                except (KeyError, ValueError) as e:
-                    raise ValueError(f"Invalid order data in {order_file}: {e}")
+            # csv.reader + positional indices resolved once from the
+            # header: no per-row dict build or per-column hash lookup
+            # the way DictReader does it
+            reader = csv.reader(f)
+            header = next(reader, None)
+            fmt: Optional[str] = None
+            try:
+                if header is not None:
+                    i_order_id = header.index('order_id')
+                    i_pickup_lat = header.index('pickup_lat')
+                    i_pickup_lng = header.index('pickup_lng')
+                    i_dropoff_lat = header.index('dropoff_lat')
+                    i_dropoff_lng = header.index('dropoff_lng')
+                    i_created = header.index('created_time')
+                    i_estimated = header.index('estimated_delivery_time_min')
+                    for row in reader:
+                        # Handle both datetime ('2025-01-15 18:07:14') and
+                        # time-only ('18:07:14') formats, detected once
+                        created_time_str = row[i_created]
+                        if fmt is None:
+                            fmt = '%Y-%m-%d %H:%M:%S' if ' ' in created_time_str else '%H:%M:%S'
+                        created_time = datetime.strptime(created_time_str, fmt).time()
+                        estimated_time = int(row[i_estimated])
+                        orders.append(Order(
+                            order_id=row[i_order_id],
+                            pickup_lat=float(row[i_pickup_lat]),
+                            pickup_lng=float(row[i_pickup_lng]),
+                            dropoff_lat=float(row[i_dropoff_lat]),
+                            dropoff_lng=float(row[i_dropoff_lng]),
+                            created_time=created_time,
+                            deadline=_deadline_time(created_time, estimated_time),
+                            estimated_delivery_time_min=estimated_time
+                        ))
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Invalid order data in {order_file}: {e}")
 
         drivers: List[Driver] = []
         with open(courier_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    # Handle both datetime and time-only formats
-                    available_from_str = row['available_from']
-                    if ' ' in available_from_str:
-                        # Full datetime format: '2025-01-15 17:08:00'
-                        available_from = datetime.strptime(available_from_str, '%Y-%m-%d %H:%M:%S').time()
-                    else:
-                        # Time-only format: '17:08:00'
-                        available_from = datetime.strptime(available_from_str, '%H:%M:%S').time()
-                    drivers.append(Driver(
-                        driver_id=row['courier_id'],
-                        start_lat=float(row['courier_lat']),
-                        start_lng=float(row['courier_lng']),
-                        vehicle_type=row['vehicle_type'],
-                        capacity=int(row['bundle_capacity']),
-                        available_from=available_from
-                    ))
-                except (KeyError, ValueError) as e:
-                    raise ValueError(f"Invalid courier data in {courier_file}: {e}")
-                    
+            reader = csv.reader(f)
+            header = next(reader, None)
+            fmt = None
+            try:
+                if header is not None:
+                    i_courier_id = header.index('courier_id')
+                    i_courier_lat = header.index('courier_lat')
+                    i_courier_lng = header.index('courier_lng')
+                    i_vehicle = header.index('vehicle_type')
+                    i_capacity = header.index('bundle_capacity')
+                    i_available = header.index('available_from')
+                    for row in reader:
+                        # Same one-shot format detection as the order loop
+                        available_from_str = row[i_available]
+                        if fmt is None:
+                            fmt = '%Y-%m-%d %H:%M:%S' if ' ' in available_from_str else '%H:%M:%S'
+                        drivers.append(Driver(
+                            driver_id=row[i_courier_id],
+                            start_lat=float(row[i_courier_lat]),
+                            start_lng=float(row[i_courier_lng]),
+                            vehicle_type=row[i_vehicle],
+                            capacity=int(row[i_capacity]),
+                            available_from=datetime.strptime(available_from_str, fmt).time()
+                        ))
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Invalid courier data in {courier_file}: {e}")
+
+        orders.sort(key=lambda o: o.created_time)
         return drivers, orders
 
+    @staticmethod
+    def _load_orders_pandas(order_file: str) -> List[Order]:
+        """
+        Vectorized order loading: pandas' C parser plus one batch
+        to_datetime call replace per-row strptime.
+        """
+        df = pd.read_csv(order_file)
+        if df.empty:
+            return []
+        try:
+            # Handle both datetime and time-only formats (detected once)
+            fmt = '%Y-%m-%d %H:%M:%S' if ' ' in str(df['created_time'].iloc[0]) else '%H:%M:%S'
+            created_times = pd.to_datetime(df['created_time'], format=fmt).dt.time
+            orders: List[Order] = []
+            for row, created_time in zip(df.itertuples(index=False), created_times):
+                estimated_time = int(row.estimated_delivery_time_min)
+                orders.append(Order(
+                    order_id=str(row.order_id),
+                    pickup_lat=float(row.pickup_lat),
+                    pickup_lng=float(row.pickup_lng),
+                    dropoff_lat=float(row.dropoff_lat),
+                    dropoff_lng=float(row.dropoff_lng),
+                    created_time=created_time,
+                    deadline=_deadline_time(created_time, estimated_time),
+                    estimated_delivery_time_min=estimated_time
+                ))
+            orders.sort(key=lambda o: o.created_time)
+            return orders
+        except (KeyError, AttributeError, ValueError) as e:
+            raise ValueError(f"Invalid order data in {order_file}: {e}")
+
+    @staticmethod
+    def _load_drivers_pandas(courier_file: str) -> List[Driver]:
+        """Vectorized courier loading, mirroring _load_orders_pandas."""
+        df = pd.read_csv(courier_file)
+        if df.empty:
+            return []
+        try:
+            fmt = '%Y-%m-%d %H:%M:%S' if ' ' in str(df['available_from'].iloc[0]) else '%H:%M:%S'
+            available_times = pd.to_datetime(df['available_from'], format=fmt).dt.time
+            drivers: List[Driver] = []
+            for row, available_from in zip(df.itertuples(index=False), available_times):
+                drivers.append(Driver(
+                    driver_id=str(row.courier_id),
+                    start_lat=float(row.courier_lat),
+                    start_lng=float(row.courier_lng),
+                    vehicle_type=str(row.vehicle_type),
+                    capacity=int(row.bundle_capacity),
+                    available_from=available_from
+                ))
+            return drivers
+        except (KeyError, AttributeError, ValueError) as e:
+            raise ValueError(f"Invalid courier data in {courier_file}: {e}")
+
     def _record_driver_position(self, driver: Driver) -> None:
         """Record driver's current position for route visualization."""
         if driver.driver_id not in self.driver_route_history:
@@ -253,14 +461,12 @@ class Simulation:
         
         Handles multiple stop arrivals per tick if they occur within the time window.
         """
-        for driver in self.drivers:
-            if driver.status == DriverStatus.IDLE:
-                continue
-
+        # Snapshot because route completions remove drivers mid-loop
+        for driver in list(self._active_drivers):
             # Process all stops the driver has arrived at
-            while (driver.status != DriverStatus.IDLE and 
+            while (driver.status != DriverStatus.IDLE and
                    0 <= driver.current_stop_index < len(driver.route) and
-                   self.current_time >= driver.arrival_time_at_next_stop):
+                   self._current_min >= driver.arrival_min):
                 
                 current_stop = driver.route[driver.current_stop_index]
                 order = self.orders_map[current_stop.order_id]
@@ -270,20 +476,30 @@ class Simulation:
                 self._record_driver_position(driver)
                 
                 # Process stop type
-                if current_stop.stop_type == 'PICKUP':
+                if current_stop.stop_type_code == STOP_PICKUP:
                     order.status = OrderStatus.PICKED_UP
                     order.pickup_time = self.current_time
-                elif current_stop.stop_type == 'DROPOFF':
+                elif current_stop.stop_type_code == STOP_DROPOFF:
                     order.status = OrderStatus.DELIVERED
                     order.dropoff_time = self.current_time
-                    self.completed_missions.append({
-                        "order_id": order.order_id,
-                        "driver_id": driver.driver_id,
-                        "created_time": order.created_time,
-                        "delivered_time": self.current_time,
-                    })
-                    if order in driver.assigned_orders:
+                    # Precompute the duration here (plain second arithmetic)
+                    # so get_results never touches datetime.combine
+                    created = order.created_time
+                    delivered = self.current_time
+                    created_sec = created.hour * 3600 + created.minute * 60 + created.second
+                    delivered_sec = delivered.hour * 3600 + delivered.minute * 60 + delivered.second
+                    self._mission_duration_min[self._n_completed] = (
+                        (delivered_sec - created_sec) / 60
+                    )
+                    self._mission_order_ids.append(order.order_id)
+                    self._mission_driver_ids.append(driver.driver_id)
+                    self._n_completed += 1
+                    # Single identity scan (eq=False on Order) instead of a
+                    # membership check followed by remove
+                    try:
                         driver.assigned_orders.remove(order)
+                    except ValueError:
+                        pass
 
                 # Advance to next stop
                 driver.current_stop_index += 1
@@ -291,43 +507,47 @@ class Simulation:
                 if driver.current_stop_index >= len(driver.route):
                     # Route complete - return to IDLE
                     driver.status = DriverStatus.IDLE
-                    driver.route = []
+                    driver.route = ()
+                    driver.route_leg_mins = ()
+                    driver.last_pickup_index = -1
                     driver.current_stop_index = -1
                     driver.assigned_orders = []
+                    self._active_drivers.discard(driver)
                 else:
-                    # Calculate arrival at next stop using road travel time
-                    next_stop = driver.route[driver.current_stop_index]
-                    travel_time = utils.get_travel_time(
-                        driver.current_lat, driver.current_lng, 
-                        next_stop.location[0], next_stop.location[1]
-                    )
+                    # Leg travel times were resolved at dispatch; just index
+                    travel_time = driver.route_leg_mins[driver.current_stop_index]
                     total_time = travel_time + config.SERVICE_TIME_MINS
                     driver.arrival_time_at_next_stop = utils.add_minutes_to_time(
                         self.current_time, total_time
                     )
+                    driver.arrival_min = minutes_of_day(driver.arrival_time_at_next_stop)
 
-                    # Transition to DELIVERING if only dropoffs remain
-                    remaining_stops = driver.route[driver.current_stop_index:]
-                    if all(s.stop_type == 'DROPOFF' for s in remaining_stops):
+                    # Transition to DELIVERING once past the last pickup
+                    if driver.current_stop_index > driver.last_pickup_index:
                         driver.status = DriverStatus.DELIVERING
 
     def _inject_new_orders(self) -> None:
         """Add orders to pending queue based on their creation time."""
-        orders_to_move: List[Order] = []
-        for order in self.master_orders_list:
-            if order.created_time <= self.current_time:
-                orders_to_move.append(order)
-            else:
-                break  # Orders are sorted by creation time
-        
-        for order in orders_to_move:
-            self.pending_orders.append(order)
-            self.master_orders_list.remove(order)
-            self.recent_order_times.append(order.created_time)
-            
+        # Orders are sorted by creation time, so just advance the cursor
+        master = self.master_orders_list
+        while self._master_idx < len(master):
+            order = master[self._master_idx]
+            if order.created_min > self._current_min:
+                break
+            self._master_idx += 1
+            self.pending_orders[order.order_id] = order
+            self.recent_order_times.append(order.created_min)
+
+            # An order turns urgent once less than 1/3 of its estimated
+            # time remains; push that trigger minute for the urgency check
+            heapq.heappush(self._pending_by_deadline, (
+                order.deadline_min - order.estimated_delivery_time_min / 3,
+                order.order_id,
+            ))
+
             # Track batch window start
-            if self.batch_start_time is None:
-                self.batch_start_time = self.current_time
+            if self.batch_start_min is None:
+                self.batch_start_min = self._current_min
 
     def _get_dispatch_mode(self) -> str:
         """
@@ -336,11 +556,12 @@ class Simulation:
         Returns:
             'combinatorial' for high load, 'sequential' for low load
         """
-        five_mins_ago = utils.add_minutes_to_time(
-            self.current_time, -config.COMBINATORIAL_WINDOW_MINS
-        )
-        recent_orders = [t for t in self.recent_order_times if t > five_mins_ago]
-        order_rate = len(recent_orders) / config.COMBINATORIAL_WINDOW_MINS
+        # Stamps are appended in creation order, so expiring from the left
+        # leaves exactly the in-window orders -- no filtering pass
+        cutoff = self._current_min - config.COMBINATORIAL_WINDOW_MINS
+        while self.recent_order_times and self.recent_order_times[0] <= cutoff:
+            self.recent_order_times.popleft()
+        order_rate = len(self.recent_order_times) / config.COMBINATORIAL_WINDOW_MINS
         return "combinatorial" if order_rate >= config.HIGH_LOAD_THRESHOLD else "sequential"
     
     def _should_dispatch_batch(self) -> bool:
@@ -358,95 +579,107 @@ class Simulation:
             return False
         
         # Check if batch window has elapsed
-        if self.batch_start_time is not None:
-            dummy_date = datetime.now().date()
-            batch_start_dt = datetime.combine(dummy_date, self.batch_start_time)
-            current_dt = datetime.combine(dummy_date, self.current_time)
-            elapsed_mins = (current_dt - batch_start_dt).total_seconds() / 60
-            
-            if elapsed_mins >= config.BATCH_WINDOW_MINS:
-                return True
-        
-        # Check for urgent orders
-        for order in self.pending_orders:
-            dummy_date = datetime.now().date()
-            current_dt = datetime.combine(dummy_date, self.current_time)
-            deadline_dt = datetime.combine(dummy_date, order.deadline)
-            time_to_deadline = (deadline_dt - current_dt).total_seconds() / 60
-            
-            # Urgent if less than 1/3 of estimated time remains
-            if time_to_deadline <= order.estimated_delivery_time_min / 3:
+        if self.batch_start_min is not None:
+            if self._current_min - self.batch_start_min >= config.BATCH_WINDOW_MINS:
                 return True
-        
+
+        # Check for urgent orders: only the earliest trigger can fire, so
+        # peek at the heap min after lazily dropping assigned orders
+        heap = self._pending_by_deadline
+        while heap and heap[0][1] not in self.pending_orders:
+            heapq.heappop(heap)
+        if heap and heap[0][0] <= self._current_min:
+            return True
+
         return False
 
+    def _run_adaptive(self, drivers: List[Driver], orders: List[Order], current_time):
+        """Adaptive dispatch: pick sequential or combinatorial by load."""
+        if self._get_dispatch_mode() == "sequential":
+            return self.dispatch_engine.run_sequential(drivers, orders, current_time)
+        return self.dispatch_engine.run_combinatorial(drivers, orders, current_time)
+
+    def _resolve_strategy(self, strategy: str):
+        """
+        Resolve a strategy name to its dispatch callable once, so tick
+        doesn't re-run a string-comparison ladder every tick.
+
+        Returns:
+            Tuple of (dispatch_fn or None, is_baseline)
+        """
+        dispatch_fn = {
+            "baseline": self.dispatch_engine.run_baseline,
+            "sequential": self.dispatch_engine.run_sequential,
+            "combinatorial": self.dispatch_engine.run_combinatorial,
+            "adaptive": self._run_adaptive,
+        }.get(strategy)
+        return dispatch_fn, strategy == "baseline"
+
     def tick(self, strategy: str, verbose: bool = True) -> None:
         """
         Execute a single simulation tick.
-        
+
         Args:
             strategy: Dispatch strategy ('baseline', 'sequential', 'combinatorial', 'adaptive')
             verbose: Whether to print progress
         """
+        dispatch_fn, is_baseline = self._resolve_strategy(strategy)
+        self._tick(dispatch_fn, is_baseline, verbose)
+
+    def _tick(self, dispatch_fn, is_baseline: bool, verbose: bool = True) -> None:
+        """
+        Execute a single simulation tick with a pre-resolved dispatcher.
+
+        Args:
+            dispatch_fn: Bound dispatch callable from _resolve_strategy
+                (None dispatches nothing, matching an unknown strategy)
+            is_baseline: Whether to bypass batching
+            verbose: Whether to print progress
+        """
         self._update_driver_states()
         self._inject_new_orders()
 
         assigned_in_tick: List[Order] = []
         distance_in_tick: float = 0.0
+        activated_in_tick: List[Driver] = []
 
         if self.pending_orders:
             # Baseline dispatches immediately; others use batching
-            should_dispatch = (strategy == "baseline") or self._should_dispatch_batch()
-            
+            should_dispatch = is_baseline or self._should_dispatch_batch()
+
             if should_dispatch:
-                dispatch_orders = list(self.pending_orders)
-                
-                if strategy == "baseline":
-                    assigned_in_tick, distance_in_tick = self.dispatch_engine.run_baseline(
-                        self.drivers, dispatch_orders, self.current_time
-                    )
-                elif strategy == "adaptive":
-                    mode = self._get_dispatch_mode()
-                    if mode == "sequential":
-                        assigned_in_tick, distance_in_tick = self.dispatch_engine.run_sequential(
-                            self.drivers, dispatch_orders, self.current_time
-                        )
-                    else:
-                        assigned_in_tick, distance_in_tick = self.dispatch_engine.run_combinatorial(
-                            self.drivers, dispatch_orders, self.current_time
-                        )
-                elif strategy == "sequential":
-                    assigned_in_tick, distance_in_tick = self.dispatch_engine.run_sequential(
-                        self.drivers, dispatch_orders, self.current_time
-                    )
-                elif strategy == "combinatorial":
-                    assigned_in_tick, distance_in_tick = self.dispatch_engine.run_combinatorial(
+                if dispatch_fn is not None:
+                    dispatch_orders = list(self.pending_orders.values())
+                    assigned_in_tick, distance_in_tick, activated_in_tick = dispatch_fn(
                         self.drivers, dispatch_orders, self.current_time
                     )
-                
+
                 # Reset batch timer
-                self.batch_start_time = None
+                self.batch_start_min = None
                 
         # Update distance KPI
         self.total_distance_traveled += distance_in_tick
         
-        # Remove assigned orders from pending
+        # Remove assigned orders from pending (O(1) per order)
         for order in assigned_in_tick:
-            if order in self.pending_orders:
-                self.pending_orders.remove(order)
-        
-        # Track activated drivers
-        for driver in self.drivers:
-            if len(driver.assigned_orders) > 0 or driver.status != DriverStatus.IDLE:
-                self.drivers_activated.add(driver.driver_id)
-                self._record_driver_position(driver)
-
-        # Progress logging
-        if verbose and (len(assigned_in_tick) > 0 or self.current_time.minute % 10 == 0):
+            self.pending_orders.pop(order.order_id, None)
+        
+        # Track newly activated drivers (reported by the dispatch engine,
+        # so no per-tick scan of the whole fleet)
+        for driver in activated_in_tick:
+            self.drivers_activated.add(driver.driver_id)
+            self._active_drivers.add(driver)
+            self._record_driver_position(driver)
+
+        # Progress logging: on assignments, plus a heartbeat at the
+        # scheduled 10-minute marks
+        if verbose and (assigned_in_tick or self._current_min >= self._next_log_min):
+            if self._current_min >= self._next_log_min:
+                self._next_log_min += 10
             print(f"[{self.current_time.strftime('%H:%M')}] "
                   f"Assigned: {len(assigned_in_tick)}, "
                   f"Pending: {len(self.pending_orders)}, "
-                  f"Completed: {len(self.completed_missions)}")
+                  f"Completed: {self._n_completed}")
 
         # Fleet utilization tracking
         self.total_driver_ticks += len(self.drivers)
@@ -454,10 +687,11 @@ class Simulation:
             1 for d in self.drivers if d.status != DriverStatus.IDLE
         )
         
-        # Advance simulation time
+        # Advance simulation time (both representations in lockstep)
         self.current_time = utils.add_minutes_to_time(
             self.current_time, config.SIMULATION_SPEED_MINUTES
         )
+        self._current_min += config.SIMULATION_SPEED_MINUTES
 
     def run(self, strategy: str, verbose: bool = True) -> Dict[str, Any]:
         """
@@ -473,17 +707,65 @@ class Simulation:
         if verbose:
             print(f"======== Starting Simulation: {strategy.upper()} ========")
         
-        total_orders = len(self.master_orders_list) + len(self.pending_orders)
+        total_orders = (len(self.master_orders_list) - self._master_idx
+                        + len(self.pending_orders))
         
-        while (self.current_time < self.end_time and 
-               len(self.completed_missions) < total_orders):
-            self.tick(strategy, verbose)
+        # Resolve the strategy to a bound dispatch callable once; the tick
+        # loop then skips the name lookup entirely
+        dispatch_fn, is_baseline = self._resolve_strategy(strategy)
+
+        while (self._current_min < self._end_min and
+               self._n_completed < total_orders):
+            self._tick(dispatch_fn, is_baseline, verbose)
         
         if verbose:
             print("Simulation complete. Calculating results...")
         
         return self.get_results()
 
+    @classmethod
+    def run_many(
+        cls,
+        drivers: List[Driver],
+        orders: List[Order],
+        strategies: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the same fleet and orders under several strategies in parallel.
+
+        Strategy runs are fully independent, so each one gets its own
+        process and the comparison takes roughly as long as the slowest
+        single run. When road distances are enabled, the OSRM cache is
+        warmed once here and seeded into every worker, avoiding N rounds
+        of API calls.
+
+        Args:
+            drivers: Fleet shared by all runs (each process gets its own
+                copy via pickling)
+            orders: Orders shared by all runs
+            strategies: Strategy names accepted by run()
+
+        Returns:
+            Dictionary mapping strategy name to its KPI results
+        """
+        cls._precompute_distances(drivers, orders)
+        warm_cache = utils.snapshot_osrm_cache()
+
+        max_workers = min(len(strategies), os.cpu_count() or 1)
+        results: Dict[str, Dict[str, Any]] = {}
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=utils.seed_osrm_cache,
+            initargs=(warm_cache,),
+        ) as pool:
+            futures = {
+                strategy: pool.submit(_run_strategy, strategy, drivers, orders)
+                for strategy in strategies
+            }
+            for strategy, future in futures.items():
+                results[strategy] = future.result()
+        return results
+
     def get_results(self) -> Dict[str, Any]:
         """
         Calculate and return comprehensive KPI results (30+ metrics).
@@ -497,9 +779,7 @@ class Simulation:
         Returns:
             Dictionary with all KPIs and route data for visualization
         """
-        import statistics
-        
-        total_deliveries = len(self.completed_missions)
+        total_deliveries = self._n_completed
         total_orders = len(self.orders_map)
         total_drivers = len(self.drivers)
         drivers_used = len(self.drivers_activated)
@@ -507,44 +787,35 @@ class Simulation:
         if total_deliveries == 0:
             return self._empty_results(total_orders, total_drivers)
 
-        # Calculate delivery times
-        delivery_times: List[float] = []
-        late_deliveries_30m: int = 0
-        late_deliveries_45m: int = 0
-        late_deliveries_60m: int = 0
-        on_time_deliveries: int = 0
-        early_deliveries: int = 0
-        
-        dummy_date = datetime.now().date()
-        for mission in self.completed_missions:
-            created_dt = datetime.combine(dummy_date, mission['created_time'])
-            delivered_dt = datetime.combine(dummy_date, mission['delivered_time'])
-            delivery_duration = (delivered_dt - created_dt).total_seconds() / 60
-            delivery_times.append(delivery_duration)
-            
-            if delivery_duration > 60:
-                late_deliveries_60m += 1
-            if delivery_duration > 45:
-                late_deliveries_45m += 1
-            if delivery_duration > 30:
-                late_deliveries_30m += 1
-            if delivery_duration <= 30:
-                on_time_deliveries += 1
-            if delivery_duration < 15:
-                early_deliveries += 1
-        
-        # Basic delivery time stats
-        avg_delivery_time = statistics.mean(delivery_times)
-        median_delivery_time = statistics.median(delivery_times)
-        min_delivery_time = min(delivery_times)
-        max_delivery_time = max(delivery_times)
-        std_delivery_time = statistics.stdev(delivery_times) if len(delivery_times) > 1 else 0
-        
-        # Percentiles
-        sorted_times = sorted(delivery_times)
-        p90_delivery_time = sorted_times[int(len(sorted_times) * 0.90)] if delivery_times else 0
-        p95_delivery_time = sorted_times[int(len(sorted_times) * 0.95)] if delivery_times else 0
-        p99_delivery_time = sorted_times[int(len(sorted_times) * 0.99)] if delivery_times else 0
+        # Delivery times were written into the preallocated array at
+        # mission completion; the whole KPI pass is vectorized reductions
+        # over a single slice
+        durations = self._mission_duration_min[:total_deliveries]
+
+        if _HAVE_NUMBA:
+            (avg_delivery_time, std_delivery_time,
+             min_delivery_time, max_delivery_time,
+             late_deliveries_30m, late_deliveries_45m,
+             late_deliveries_60m, early_deliveries) = _kpi_reduce(durations)
+        else:
+            late_deliveries_60m = int(np.count_nonzero(durations > 60))
+            late_deliveries_45m = int(np.count_nonzero(durations > 45))
+            late_deliveries_30m = int(np.count_nonzero(durations > 30))
+            early_deliveries = int(np.count_nonzero(durations < 15))
+            avg_delivery_time = float(durations.mean())
+            min_delivery_time = float(durations.min())
+            max_delivery_time = float(durations.max())
+            std_delivery_time = float(durations.std(ddof=1)) if total_deliveries > 1 else 0
+
+        on_time_deliveries = total_deliveries - late_deliveries_30m
+        median_delivery_time = float(np.median(durations))
+
+        # Percentiles via selection (O(N)) rather than a full sort
+        p_indices = [int(total_deliveries * q) for q in (0.90, 0.95, 0.99)]
+        partitioned = np.partition(durations, p_indices)
+        p90_delivery_time = float(partitioned[p_indices[0]])
+        p95_delivery_time = float(partitioned[p_indices[1]])
+        p99_delivery_time = float(partitioned[p_indices[2]])
         
         # Fleet metrics
         fleet_utilization: float = 0.0
@@ -615,26 +886,43 @@ class Simulation:
             # Efficiency scores
             "time_efficiency_ratio": round(time_efficiency, 4),
             "active_driver_efficiency": round(active_driver_efficiency, 2),
-            
-            # Legacy format for backward compatibility with app.py
-            "Total Deliveries": total_deliveries,
-            "Avg Delivery Time": f"{avg_delivery_time:.2f} min",
-            "Total Fleet Distance": f"{self.total_distance_traveled:.2f} km",
-            "Late Deliveries (>60m)": late_deliveries_60m,
-            "Fleet Utilization": f"{fleet_utilization:.2f}%",
-            "Drivers Used": drivers_used,
-            "Active Driver Efficiency": f"{active_driver_efficiency:.2f}",
-            "Orders Delivered": f"{total_deliveries}/{total_orders}",
-            "Min Delivery Time": f"{min_delivery_time:.2f} min",
-            "Max Delivery Time": f"{max_delivery_time:.2f} min",
-            "Avg Distance/Order": f"{avg_distance_per_order:.2f} km",
-            "Late Deliveries (>45m)": late_deliveries_45m,
-            "Orders/Driver": f"{orders_per_driver:.2f}",
-            
+
             # Route data for visualization
             "driver_routes": self.driver_route_history,
         }
-    
+
+    def get_display_dict(self, results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build the Title-Case display strings used by the UI/CLI tables.
+
+        Formatting only happens here, at the single display site, so
+        callers that just compare numeric KPIs (e.g. multi-strategy
+        benchmark runs) never pay for the f-strings.
+
+        Args:
+            results: Numeric results from get_results(); computed if omitted
+
+        Returns:
+            Numeric results merged with the legacy display keys
+        """
+        r = results if results is not None else self.get_results()
+        return {
+            **r,
+            "Total Deliveries": r["orders_delivered"],
+            "Avg Delivery Time": f"{r['avg_delivery_time_min']:.2f} min",
+            "Total Fleet Distance": f"{r['total_fleet_distance_km']:.2f} km",
+            "Late Deliveries (>60m)": r["late_deliveries_over_60m"],
+            "Fleet Utilization": f"{r['fleet_utilization_pct']:.2f}%",
+            "Drivers Used": r["drivers_used"],
+            "Active Driver Efficiency": f"{r['active_driver_efficiency']:.2f}",
+            "Orders Delivered": f"{r['orders_delivered']}/{r['total_orders']}",
+            "Min Delivery Time": f"{r['min_delivery_time_min']:.2f} min",
+            "Max Delivery Time": f"{r['max_delivery_time_min']:.2f} min",
+            "Avg Distance/Order": f"{r['avg_distance_per_order_km']:.2f} km",
+            "Late Deliveries (>45m)": r["late_deliveries_over_45m"],
+            "Orders/Driver": f"{r['orders_per_driver']:.2f}",
+        }
+
     def _empty_results(self, total_orders: int, total_drivers: int) -> Dict[str, Any]:
         """Return empty results structure."""
         return {
@@ -668,20 +956,6 @@ class Simulation:
             "late_rate_60m_pct": 0,
             "time_efficiency_ratio": 0,
             "active_driver_efficiency": 0,
-            # Legacy format
-            "Total Deliveries": 0,
-            "Avg Delivery Time": "0.00 min",
-            "Total Fleet Distance": "0.00 km",
-            "Late Deliveries (>60m)": 0,
-            "Fleet Utilization": "0.00%",
-            "Drivers Used": 0,
-            "Active Driver Efficiency": "0.00",
-            "Orders Delivered": f"0/{total_orders}",
-            "Min Delivery Time": "0.00 min",
-            "Max Delivery Time": "0.00 min",
-            "Avg Distance/Order": "0.00 km",
-            "Late Deliveries (>45m)": 0,
-            "Orders/Driver": "0.00",
             "driver_routes": {},
         }
 
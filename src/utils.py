@@ -10,18 +10,69 @@ from __future__ import annotations
 
 import math
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import time, timedelta, datetime
 from functools import lru_cache
 from typing import Union, Tuple, Optional
+
+import numpy as np
 import requests
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional; kernels below fall back to NumPy/math
+    _HAVE_NUMBA = False
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:  # orjson is optional; response parsing falls back to stdlib json
+    _HAVE_ORJSON = False
+
 from . import config
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Module-level cache for OSRM results (separate from lru_cache for more control)
-_osrm_cache: dict[Tuple[float, float, float, float], Tuple[float, float]] = {}
+# Shared HTTP session with pooled keep-alive connections: OSRM calls reuse
+# sockets instead of paying a TCP (and possibly TLS) handshake per request
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
+def close_osrm_session() -> None:
+    """Close the pooled OSRM HTTP session (for clean shutdown)."""
+    _session.close()
+
+
+def _parse_json(response: requests.Response) -> dict:
+    """
+    Decode an OSRM response body.
+
+    orjson parses the raw bytes directly (no intermediate str decode),
+    which matters for table responses carrying N x N float matrices;
+    stdlib response.json() is the fallback.
+    """
+    if _HAVE_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Module-level LRU cache for OSRM results (separate from lru_cache for more
+# control): hits move entries to the end, overflow evicts the oldest in O(1)
+_osrm_cache: OrderedDict[Tuple[float, float, float, float], Tuple[float, float]] = OrderedDict()
+
+# Hot trig functions bound once at module scope: each saves a
+# LOAD_GLOBAL + LOAD_ATTR pair per call in the interpreted distance
+# paths. The numba kernels resolve math.* at compile time and are
+# unaffected.
+_radians, _sin, _cos, _asin, _sqrt, _hypot = (
+    math.radians, math.sin, math.cos, math.asin, math.sqrt, math.hypot,
+)
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -44,25 +95,202 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         >>> haversine_distance(25.2854, 51.5310, 25.2900, 51.5350)
         0.623  # ~623 meters
     """
-    # Convert decimal degrees to radians
-    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
+    return _haversine_cached(lat1, lon1, lat2, lon2)
+
+
+@lru_cache(maxsize=100_000)
+def _haversine_cached(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Memoized scalar Haversine kernel.
+
+    Dispatch revisits the same driver/stop coordinate pairs tick after
+    tick, so repeats resolve from lru_cache's C-level table instead of
+    re-running the trig. Keyed on the exact coordinates (not the rounded
+    OSRM cache key) so cached and fresh results are bit-identical.
+    """
+    if _HAVE_NUMBA:
+        return _haversine_scalar_nb(lat1, lon1, lat2, lon2)
+
+    # Convert decimal degrees to radians (inline, no map/list allocation)
+    lon1 = _radians(lon1)
+    lat1 = _radians(lat1)
+    lon2 = _radians(lon2)
+    lat2 = _radians(lat2)
 
     # Haversine formula
     dlon = lon2 - lon1
     dlat = lat2 - lat1
-    a = math.sin(dlat / 2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    
+    a = _sin(dlat / 2)**2 + _cos(lat1) * _cos(lat2) * _sin(dlon / 2)**2
+    c = 2 * _asin(_sqrt(a))
+
     # Radius of Earth in kilometers
     r = 6371
     return c * r
 
 
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _haversine_scalar_nb(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """JIT-compiled scalar kernel; mirrors haversine_distance exactly."""
+        lon1 = math.radians(lon1)
+        lat1 = math.radians(lat1)
+        lon2 = math.radians(lon2)
+        lat2 = math.radians(lat2)
+
+        dlon = lon2 - lon1
+        dlat = lat2 - lat1
+        a = math.sin(dlat / 2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2)**2
+        c = 2 * math.asin(math.sqrt(a))
+
+        return c * 6371
+
+    @njit(cache=True, parallel=True)
+    def _haversine_matrix_nb(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+        """JIT-compiled pairwise kernel over pre-radianized coordinates."""
+        n = lat.shape[0]
+        out = np.empty((n, n), dtype=np.float64)
+
+        for i in prange(n):
+            for j in range(n):
+                dlat = lat[i] - lat[j]
+                dlng = lng[i] - lng[j]
+                a = math.sin(dlat / 2)**2 + math.cos(lat[i]) * math.cos(lat[j]) * math.sin(dlng / 2)**2
+                out[i, j] = 2 * 6371 * math.asin(math.sqrt(a))
+
+        return out
+
+
+def haversine_matrix(lats: "np.ndarray", lngs: "np.ndarray") -> "np.ndarray":
+    """
+    Compute the full pairwise great-circle distance matrix for a set of points.
+
+    Vectorized equivalent of calling `haversine_distance` on every pair:
+    one broadcasted NumPy expression instead of O(n^2) Python calls.
+
+    Args:
+        lats: Array of latitudes in decimal degrees, shape (n,)
+        lngs: Array of longitudes in decimal degrees, shape (n,)
+
+    Returns:
+        (n, n) array where entry [i, j] is the distance in kilometers
+        between point i and point j
+    """
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lng = np.radians(np.asarray(lngs, dtype=np.float64))
+
+    if _HAVE_NUMBA:
+        # Parallel JIT kernel: LLVM vectorizes the trig loop per thread
+        return _haversine_matrix_nb(lat, lng)
+
+    dlat = lat[:, None] - lat[None, :]
+    dlng = lng[:, None] - lng[None, :]
+    a = np.sin(dlat / 2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlng / 2)**2
+
+    # Radius of Earth in kilometers
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def haversine_vector(lat1: float, lon1: float, lats: "np.ndarray", lngs: "np.ndarray") -> "np.ndarray":
+    """
+    Compute great-circle distances from one point to many points.
+
+    Vectorized one-to-many companion of `haversine_matrix`.
+
+    Args:
+        lat1: Latitude of the origin in decimal degrees
+        lon1: Longitude of the origin in decimal degrees
+        lats: Array of destination latitudes, shape (n,)
+        lngs: Array of destination longitudes, shape (n,)
+
+    Returns:
+        (n,) array of distances in kilometers
+    """
+    lat0 = math.radians(lat1)
+    lng0 = math.radians(lon1)
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lng = np.radians(np.asarray(lngs, dtype=np.float64))
+
+    dlat = lat - lat0
+    dlng = lng - lng0
+    a = np.sin(dlat / 2)**2 + math.cos(lat0) * np.cos(lat) * np.sin(dlng / 2)**2
+
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def haversine_cross(
+    lats1: "np.ndarray", lngs1: "np.ndarray",
+    lats2: "np.ndarray", lngs2: "np.ndarray",
+) -> "np.ndarray":
+    """
+    Compute great-circle distances between two sets of points.
+
+    Vectorized many-to-many companion of `haversine_matrix` for distinct
+    origin and destination sets (e.g. driver positions vs. order pickups).
+
+    Args:
+        lats1: Origin latitudes in decimal degrees, shape (m,)
+        lngs1: Origin longitudes in decimal degrees, shape (m,)
+        lats2: Destination latitudes in decimal degrees, shape (n,)
+        lngs2: Destination longitudes in decimal degrees, shape (n,)
+
+    Returns:
+        (m, n) array where entry [i, j] is the distance in kilometers
+        from origin i to destination j
+    """
+    lat_a = np.radians(np.asarray(lats1, dtype=np.float64))
+    lng_a = np.radians(np.asarray(lngs1, dtype=np.float64))
+    lat_b = np.radians(np.asarray(lats2, dtype=np.float64))
+    lng_b = np.radians(np.asarray(lngs2, dtype=np.float64))
+
+    dlat = lat_a[:, None] - lat_b[None, :]
+    dlng = lng_a[:, None] - lng_b[None, :]
+    a = np.sin(dlat / 2)**2 + np.cos(lat_a)[:, None] * np.cos(lat_b)[None, :] * np.sin(dlng / 2)**2
+
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+
+def equirect_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Fast equirectangular approximation of the great-circle distance.
+
+    Projects the pair onto a plane at their mean latitude and takes the
+    Euclidean distance: one cos + one hypot instead of the full Haversine
+    trig chain. Within ~0.1% of `haversine_distance` at last-mile ranges
+    (sub-5 km), so it is suitable for ranking and radius prefilters, but
+    NOT as a drop-in for exact distances fed into costs or KPIs.
+
+    Args:
+        lat1: Latitude of point 1 in decimal degrees
+        lon1: Longitude of point 1 in decimal degrees
+        lat2: Latitude of point 2 in decimal degrees
+        lon2: Longitude of point 2 in decimal degrees
+
+    Returns:
+        Approximate distance in kilometers between the two points
+    """
+    x = _radians(lon2 - lon1) * _cos(_radians((lat1 + lat2) / 2))
+    y = _radians(lat2 - lat1)
+    return 6371 * _hypot(x, y)
+
+
 def _get_cache_key(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float, float, float]:
     """Create a cache key with rounded coordinates (5 decimal places ≈ 1m precision)."""
     return (round(lat1, 5), round(lon1, 5), round(lat2, 5), round(lon2, 5))
 
 
+def _route_cache_key(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float, float, float]:
+    """
+    Cache key for a route, canonicalized when routes are assumed symmetric.
+
+    With OSRM_ASSUME_SYMMETRIC the endpoint pair is ordered so (A, B) and
+    (B, A) share one entry and a lookup costs a single probe; otherwise
+    the key is directional.
+    """
+    if config.OSRM_ASSUME_SYMMETRIC and (lat2, lon2) < (lat1, lon1):
+        lat1, lon1, lat2, lon2 = lat2, lon2, lat1, lon1
+    return _get_cache_key(lat1, lon1, lat2, lon2)
+
+
 def osrm_route(
     lat1: float, lon1: float, 
     lat2: float, lon2: float
@@ -85,15 +313,20 @@ def osrm_route(
     Note:
         OSRM expects coordinates in lon,lat order (not lat,lon).
     """
-    # Check cache first
-    cache_key = _get_cache_key(lat1, lon1, lat2, lon2)
+    # Check cache first (a hit refreshes the entry's LRU position). With a
+    # canonical symmetric key this is the only probe needed.
+    cache_key = _route_cache_key(lat1, lon1, lat2, lon2)
     if cache_key in _osrm_cache:
+        _osrm_cache.move_to_end(cache_key)
         return _osrm_cache[cache_key]
-    
-    # Also check reverse direction (roads are often bidirectional with same distance)
-    reverse_key = _get_cache_key(lat2, lon2, lat1, lon1)
-    if reverse_key in _osrm_cache:
-        return _osrm_cache[reverse_key]
+
+    if not config.OSRM_ASSUME_SYMMETRIC:
+        # Directional keys: still try the reverse direction (roads are
+        # often bidirectional with the same distance)
+        reverse_key = _get_cache_key(lat2, lon2, lat1, lon1)
+        if reverse_key in _osrm_cache:
+            _osrm_cache.move_to_end(reverse_key)
+            return _osrm_cache[reverse_key]
     
     try:
         # OSRM expects lon,lat order
@@ -103,10 +336,10 @@ def osrm_route(
             f"?overview=false"  # Don't need the geometry, saves bandwidth
         )
         
-        response = requests.get(url, timeout=config.OSRM_TIMEOUT_SECONDS)
+        response = _session.get(url, timeout=config.OSRM_TIMEOUT_SECONDS)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
         if data.get("code") != "Ok" or not data.get("routes"):
             logger.warning(f"OSRM returned no route: {data.get('code')}")
@@ -118,13 +351,10 @@ def osrm_route(
         
         result = (distance_km, duration_min)
         
-        # Cache the result (enforce cache size limit)
+        # Cache the result, evicting the least-recently-used entry on overflow
         if len(_osrm_cache) >= config.OSRM_CACHE_SIZE:
-            # Remove oldest entries (first 10% of cache)
-            keys_to_remove = list(_osrm_cache.keys())[:config.OSRM_CACHE_SIZE // 10]
-            for key in keys_to_remove:
-                del _osrm_cache[key]
-        
+            _osrm_cache.popitem(last=False)
+
         _osrm_cache[cache_key] = result
         return result
         
@@ -168,34 +398,56 @@ def get_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return haversine_distance(lat1, lon1, lat2, lon2)
 
 
+def get_distance_and_time(
+    lat1: float, lon1: float, lat2: float, lon2: float
+) -> Tuple[float, float]:
+    """
+    Get both distance and travel time for a pair of points in one call.
+
+    Callers that need the full (how far, how long) answer should use this
+    instead of get_distance + get_travel_time, which would hit the OSRM
+    cache (and, on a miss, the OSRM API) twice for the same pair.
+
+    Args:
+        lat1: Latitude of point 1 in decimal degrees
+        lon1: Longitude of point 1 in decimal degrees
+        lat2: Latitude of point 2 in decimal degrees
+        lon2: Longitude of point 2 in decimal degrees
+
+    Returns:
+        Tuple of (distance_km, travel_time_minutes)
+    """
+    if config.USE_ROAD_DISTANCE:
+        result = osrm_route(lat1, lon1, lat2, lon2)
+        if result is not None:
+            return result
+
+        # Fallback to Haversine with multiplier
+        distance = haversine_distance(lat1, lon1, lat2, lon2) * config.HAVERSINE_FALLBACK_MULTIPLIER
+        return distance, calculate_travel_time_minutes(distance)
+
+    distance = haversine_distance(lat1, lon1, lat2, lon2)
+    return distance, calculate_travel_time_minutes(distance)
+
+
 def get_travel_time(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Get the travel time between two points using the configured method.
-    
+
     When OSRM is enabled, returns the actual road travel time which accounts
     for road types (highway vs. residential) and typical speeds.
     When disabled, uses distance-based estimation with average speed.
-    
+
     Args:
         lat1: Latitude of point 1 in decimal degrees
         lon1: Longitude of point 1 in decimal degrees
         lat2: Latitude of point 2 in decimal degrees
         lon2: Longitude of point 2 in decimal degrees
-        
+
     Returns:
         Estimated travel time in minutes
     """
-    if config.USE_ROAD_DISTANCE:
-        result = osrm_route(lat1, lon1, lat2, lon2)
-        if result is not None:
-            return result[1]  # Return duration_min
-        
-        # Fallback: calculate from Haversine distance with multiplier
-        distance = haversine_distance(lat1, lon1, lat2, lon2) * config.HAVERSINE_FALLBACK_MULTIPLIER
-        return calculate_travel_time_minutes(distance)
-    
-    distance = haversine_distance(lat1, lon1, lat2, lon2)
-    return calculate_travel_time_minutes(distance)
+    return get_distance_and_time(lat1, lon1, lat2, lon2)[1]
 
 
 def clear_osrm_cache() -> int:
@@ -205,12 +457,31 @@ def clear_osrm_cache() -> int:
     Returns:
         Number of cached entries that were cleared
     """
-    global _osrm_cache
     count = len(_osrm_cache)
-    _osrm_cache = {}
+    _osrm_cache.clear()
     return count
 
 
+def snapshot_osrm_cache() -> dict:
+    """
+    Return a shallow copy of the OSRM route cache.
+
+    Used to hand a warmed cache to worker processes (values are plain
+    float tuples, so a shallow copy is safe to pickle).
+    """
+    return dict(_osrm_cache)
+
+
+def seed_osrm_cache(entries: dict) -> None:
+    """
+    Merge precomputed entries into the OSRM route cache.
+
+    Intended as a ProcessPoolExecutor initializer so child processes
+    start from the parent's warmed cache instead of re-querying OSRM.
+    """
+    _osrm_cache.update(entries)
+
+
 def get_osrm_cache_stats() -> dict:
     """
     Get statistics about the OSRM cache.
@@ -227,23 +498,28 @@ def get_osrm_cache_stats() -> dict:
 
 def osrm_table(
     locations: list[Tuple[float, float]],
-    max_locations: int = 100
-) -> Optional[Tuple[list[list[float]], list[list[float]]]]:
+    max_locations: int = 100,
+    sources: Optional[list[int]] = None,
+    destinations: Optional[list[int]] = None,
+) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
     """
     Get distance and duration matrix for multiple locations using OSRM Table API.
-    
+
     This is MUCH more efficient than individual route calls - gets all pairwise
     distances in a single API request instead of O(N^2) individual calls.
-    
+
     Args:
         locations: List of (lat, lng) tuples
         max_locations: Maximum locations per request (public OSRM limit is ~100)
-        
+        sources: Optional indices into `locations` to use as matrix rows
+        destinations: Optional indices into `locations` to use as columns
+
     Returns:
-        Tuple of (distances_matrix, durations_matrix) where each is a 2D list.
-        distances[i][j] = distance in km from location i to j
-        durations[i][j] = duration in minutes from location i to j
-        Returns None if the API call fails.
+        Tuple of (distances_matrix, durations_matrix) float64 arrays.
+        distances[i, j] = distance in km from source i to destination j
+        (all locations act as both when sources/destinations are omitted).
+        durations[i, j] = duration in minutes from source i to destination j.
+        Unroutable pairs are np.inf. Returns None if the API call fails.
     """
     if len(locations) < 2:
         return None
@@ -261,28 +537,32 @@ def osrm_table(
             f"{config.OSRM_SERVER_URL}/table/v1/driving/{coords}"
             f"?annotations=distance,duration"
         )
-        
-        response = requests.get(url, timeout=config.OSRM_TIMEOUT_SECONDS * 3)  # Longer timeout for table
+        if sources is not None:
+            url += "&sources=" + ";".join(map(str, sources))
+        if destinations is not None:
+            url += "&destinations=" + ";".join(map(str, destinations))
+
+        response = _session.get(url, timeout=config.OSRM_TIMEOUT_SECONDS * 3)  # Longer timeout for table
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
         if data.get("code") != "Ok":
             logger.warning(f"OSRM table returned error: {data.get('code')}")
             return None
         
-        # Convert distances from meters to km
-        distances = [
-            [d / 1000 if d is not None else float('inf') for d in row]
-            for row in data["distances"]
-        ]
-        
-        # Convert durations from seconds to minutes
-        durations = [
-            [d / 60 if d is not None else float('inf') for d in row]
-            for row in data["durations"]
-        ]
-        
+        # Dense float64 arrays (8 bytes/cell vs a PyFloat each) with one
+        # vectorized unit conversion; None (unroutable) becomes inf
+        distances = np.asarray(
+            [[d if d is not None else np.inf for d in row] for row in data["distances"]],
+            dtype=np.float64,
+        ) / 1000  # meters -> km
+
+        durations = np.asarray(
+            [[d if d is not None else np.inf for d in row] for row in data["durations"]],
+            dtype=np.float64,
+        ) / 60  # seconds -> minutes
+
         return distances, durations
         
     except requests.exceptions.Timeout:
@@ -296,6 +576,99 @@ def osrm_table(
         return None
 
 
+def _prefetch_osrm_tiles(
+    result: dict,
+    locations: list[Tuple[float, float]],
+    chunk_size: int,
+) -> bool:
+    """
+    Tiled parallel OSRM table prefetch for sets above the per-request limit.
+
+    Splits the locations into tiles of half the request limit and fetches
+    each (source tile, destination tile) block as its own table call, so
+    a combined request never exceeds `chunk_size` coordinates. The calls
+    run on a thread pool: they are network-bound, so round-trips overlap.
+
+    Returns:
+        True if every tile succeeded (result and the OSRM cache are then
+        fully populated), False to signal the caller to fall back.
+    """
+    tile = max(chunk_size // 2, 2)
+    blocks = [locations[i:i + tile] for i in range(0, len(locations), tile)]
+
+    def fetch(a: int, b: int):
+        if a == b:
+            return osrm_table(blocks[a], max_locations=chunk_size)
+        combined = blocks[a] + blocks[b]
+        n_src = len(blocks[a])
+        return osrm_table(
+            combined,
+            max_locations=chunk_size,
+            sources=list(range(n_src)),
+            destinations=list(range(n_src, len(combined))),
+        )
+
+    jobs = [(a, b) for a in range(len(blocks)) for b in range(len(blocks))]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {pool.submit(fetch, a, b): (a, b) for a, b in jobs}
+        for future in as_completed(futures):
+            table = future.result()
+            if table is None:
+                return False
+
+            a, b = futures[future]
+            distances, durations = table
+            # Stitched in the main thread, so no locking is needed
+            for i, loc1 in enumerate(blocks[a]):
+                for j, loc2 in enumerate(blocks[b]):
+                    if loc1 != loc2:
+                        entry = (distances[i, j], durations[i, j])
+                        result[(loc1, loc2)] = entry
+                        cache_key = _route_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])
+                        _osrm_cache[cache_key] = entry
+    return True
+
+
+def _fill_haversine_pairs(
+    result: dict,
+    locations: list[Tuple[float, float]],
+    multiplier: float,
+) -> None:
+    """
+    Batch-fill all pairwise Haversine distances into `result` and the
+    OSRM cache.
+
+    One haversine_matrix call replaces O(n^2) scalar haversine_distance
+    calls; the remaining double loop only builds the dict entries.
+    """
+    n = len(locations)
+    lats = np.fromiter((loc[0] for loc in locations), dtype=np.float64, count=n)
+    lngs = np.fromiter((loc[1] for loc in locations), dtype=np.float64, count=n)
+
+    dists = haversine_matrix(lats, lngs) * multiplier
+    if config.AVG_SPEED_KMH > 0:
+        times = (dists / config.AVG_SPEED_KMH) * 60
+    else:
+        times = np.full_like(dists, np.inf)
+
+    # Haversine is symmetric, so one upper-triangular pass stores both
+    # directions -- half the dict insertions of the full double loop
+    for i, loc1 in enumerate(locations):
+        row_d = dists[i]
+        row_t = times[i]
+        for j in range(i + 1, n):
+            loc2 = locations[j]
+            entry = (row_d[j], row_t[j])
+            result[(loc1, loc2)] = entry
+            result[(loc2, loc1)] = entry
+
+            # Cache for individual lookups (one canonical entry when the
+            # route cache is symmetric, both directions otherwise)
+            _osrm_cache[_route_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])] = entry
+            if not config.OSRM_ASSUME_SYMMETRIC:
+                _osrm_cache[_get_cache_key(loc2[0], loc2[1], loc1[0], loc1[1])] = entry
+
+
 def precompute_distances(
     locations: list[Tuple[float, float]],
     chunk_size: int = 100
@@ -303,8 +676,9 @@ def precompute_distances(
     """
     Precompute all pairwise distances for a set of locations.
     
-    Uses OSRM Table API for efficiency when possible. For larger datasets,
-    falls back to Haversine with a realistic multiplier.
+    Uses OSRM Table API for efficiency when possible; larger datasets are
+    prefetched as parallel tile requests. Falls back to Haversine with a
+    realistic multiplier when OSRM is disabled or unreachable.
     
     Args:
         locations: List of (lat, lng) tuples
@@ -320,19 +694,18 @@ def precompute_distances(
     
     # For datasets larger than chunk_size, use Haversine with multiplier
     # This is a practical tradeoff for hackathon performance
-    if not config.USE_ROAD_DISTANCE or len(locations) > chunk_size:
-        multiplier = config.HAVERSINE_FALLBACK_MULTIPLIER if config.USE_ROAD_DISTANCE else 1.0
-        
-        for i, loc1 in enumerate(locations):
-            for j, loc2 in enumerate(locations):
-                if i != j:
-                    dist = haversine_distance(loc1[0], loc1[1], loc2[0], loc2[1]) * multiplier
-                    time_mins = calculate_travel_time_minutes(dist)
-                    result[(loc1, loc2)] = (dist, time_mins)
-                    
-                    # Cache for individual lookups
-                    cache_key = _get_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])
-                    _osrm_cache[cache_key] = (dist, time_mins)
+    if not config.USE_ROAD_DISTANCE:
+        _fill_haversine_pairs(result, locations, 1.0)
+        return result
+
+    if len(locations) > chunk_size:
+        # Too many points for a single table request: prefetch road
+        # distances as parallel tile requests instead of giving up
+        if _prefetch_osrm_tiles(result, locations, chunk_size):
+            return result
+        logger.info("OSRM tile prefetch failed, using Haversine with multiplier")
+        result.clear()
+        _fill_haversine_pairs(result, locations, config.HAVERSINE_FALLBACK_MULTIPLIER)
         return result
     
     # Try OSRM table API for smaller datasets
@@ -343,26 +716,18 @@ def precompute_distances(
         for i, loc1 in enumerate(locations):
             for j, loc2 in enumerate(locations):
                 if i != j:
-                    dist = distances[i][j]
-                    dur = durations[i][j]
+                    dist = distances[i, j]
+                    dur = durations[i, j]
                     result[(loc1, loc2)] = (dist, dur)
-                    
+
                     # Also populate the cache for individual lookups
-                    cache_key = _get_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])
+                    cache_key = _route_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])
                     _osrm_cache[cache_key] = (dist, dur)
     else:
         # Fall back to Haversine with multiplier
         logger.info("OSRM table failed, using Haversine with multiplier")
-        for i, loc1 in enumerate(locations):
-            for j, loc2 in enumerate(locations):
-                if i != j:
-                    dist = haversine_distance(loc1[0], loc1[1], loc2[0], loc2[1]) * config.HAVERSINE_FALLBACK_MULTIPLIER
-                    time_mins = calculate_travel_time_minutes(dist)
-                    result[(loc1, loc2)] = (dist, time_mins)
-                    
-                    cache_key = _get_cache_key(loc1[0], loc1[1], loc2[0], loc2[1])
-                    _osrm_cache[cache_key] = (dist, time_mins)
-    
+        _fill_haversine_pairs(result, locations, config.HAVERSINE_FALLBACK_MULTIPLIER)
+
     return result
 
 
@@ -387,27 +752,38 @@ def calculate_travel_time_minutes(distance_km: float) -> float:
     return (distance_km / config.AVG_SPEED_KMH) * 60
 
 
+# Fixed dummy date for timedelta arithmetic: the date never affects the
+# returned time-of-day, so there is no reason to ask the OS for today's
+_DUMMY_DATE = datetime(2000, 1, 1).date()
+
+
 def add_minutes_to_time(base_time: time, minutes_to_add: Union[int, float]) -> time:
     """
     Add a number of minutes to a datetime.time object.
-    
+
     Note: This is designed for single-day simulations. Times past midnight
     will wrap around, which may cause unexpected behavior in multi-day scenarios.
-    
+
     Args:
         base_time: The starting time
         minutes_to_add: Number of minutes to add (can be negative)
-        
+
     Returns:
         A new time object with the minutes added
-        
+
     Example:
         >>> add_minutes_to_time(time(18, 30), 45)
         datetime.time(19, 15)
     """
-    # Use a dummy date to leverage timedelta arithmetic
-    dummy_date = datetime.now().date()
-    base_datetime = datetime.combine(dummy_date, base_time)
+    # Whole minutes (the per-tick clock advance) need no datetime round
+    # trip: plain integer arithmetic, wrapping at midnight like timedelta
+    if isinstance(minutes_to_add, int):
+        total = base_time.hour * 60 + base_time.minute + minutes_to_add
+        return time((total // 60) % 24, total % 60,
+                    base_time.second, base_time.microsecond)
+
+    # Fractional minutes keep timedelta's exact sub-minute arithmetic
+    base_datetime = datetime.combine(_DUMMY_DATE, base_time)
     result_datetime = base_datetime + timedelta(minutes=minutes_to_add)
     return result_datetime.time()
 
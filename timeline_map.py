@@ -9,14 +9,19 @@ Shows drivers and orders on a map with a time slider for baseline/sequential/com
 from __future__ import annotations
 
 import copy
+import hashlib
+import pickle
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 import pydeck as pdk
 
 from src import config, utils
-from src.models import Driver, DriverStatus, Order
+from src.models import Driver, DriverStatus, Order, OrderStatus
 from src.simulation import Simulation
 
 # -----------------------------------------------------------------------------
@@ -125,7 +130,7 @@ def run_with_trace(strategy: str) -> List[Dict]:
 
     while (
         sim.current_time < sim.end_time
-        and len(sim.completed_missions) < len(sim.orders_map)
+        and sim._n_completed < len(sim.orders_map)
         and len(timeline) < 60
     ):
         sim._update_driver_states()
@@ -133,35 +138,35 @@ def run_with_trace(strategy: str) -> List[Dict]:
 
         assigned_in_tick: List[str] = []
         distance_in_tick: float = 0.0
+        activated_in_tick = []
 
         if sim.pending_orders:
             should_dispatch = (strategy == "baseline") or sim._should_dispatch_batch()
             if should_dispatch:
-                dispatch_orders = list(sim.pending_orders)
+                dispatch_orders = list(sim.pending_orders.values())
                 if strategy == "baseline":
-                    assigned_in_tick, distance_in_tick = sim.dispatch_engine.run_baseline(
+                    assigned_in_tick, distance_in_tick, activated_in_tick = sim.dispatch_engine.run_baseline(
                         sim.drivers, dispatch_orders, sim.current_time
                     )
                 elif strategy == "sequential":
-                    assigned_in_tick, distance_in_tick = sim.dispatch_engine.run_sequential(
+                    assigned_in_tick, distance_in_tick, activated_in_tick = sim.dispatch_engine.run_sequential(
                         sim.drivers, dispatch_orders, sim.current_time
                     )
                 elif strategy == "combinatorial":
-                    assigned_in_tick, distance_in_tick = sim.dispatch_engine.run_combinatorial(
+                    assigned_in_tick, distance_in_tick, activated_in_tick = sim.dispatch_engine.run_combinatorial(
                         sim.drivers, dispatch_orders, sim.current_time
                     )
-                sim.batch_start_time = None
+                sim.batch_start_min = None
 
         sim.total_distance_traveled += distance_in_tick
 
         for order in assigned_in_tick:
-            if order in sim.pending_orders:
-                sim.pending_orders.remove(order)
+            sim.pending_orders.pop(order.order_id, None)
 
-        for driver in sim.drivers:
-            if len(driver.assigned_orders) > 0 or driver.status != DriverStatus.IDLE:
-                sim.drivers_activated.add(driver.driver_id)
-                sim._record_driver_position(driver)
+        for driver in activated_in_tick:
+            sim.drivers_activated.add(driver.driver_id)
+            sim._active_drivers.add(driver)
+            sim._record_driver_position(driver)
 
         driver_snap = []
         for d in sim.drivers:
@@ -173,59 +178,133 @@ def run_with_trace(strategy: str) -> List[Dict]:
                     "id": d.driver_id,
                     "lat": d.current_lat,
                     "lng": d.current_lng,
-                    "status": d.status.value,
+                    "status": d.status.name,
                     "assigned": [o.order_id for o in d.assigned_orders],
                     "plan": remaining_stops,
                 }
             )
 
+        # Single pass over orders_map: pending_orders is a dict keyed by
+        # order_id, so membership checks are O(1), and comparing the enum
+        # by identity avoids a .name string compare per order
+        completed: List[str] = []
+        in_progress: List[str] = []
+        for o in sim.orders_map.values():
+            if o.status is OrderStatus.DELIVERED:
+                completed.append(o.order_id)
+            elif o.order_id not in sim.pending_orders:
+                in_progress.append(o.order_id)
+
         timeline.append(
             {
                 "time": sim.current_time.strftime("%H:%M"),
                 "assigned": [{"order": o.order_id, "driver": next((d.driver_id for d in sim.drivers if o in d.assigned_orders), "?")} for o in assigned_in_tick],
-                "pending": [o.order_id for o in sim.pending_orders],
-                "completed": [o.order_id for o in sim.orders_map.values() if o.status.name == "DELIVERED"],
-                "in_progress": [o.order_id for o in sim.orders_map.values() if o.status.name != "DELIVERED" and o not in sim.pending_orders],
+                "pending": list(sim.pending_orders),
+                "completed": completed,
+                "in_progress": in_progress,
                 "drivers": driver_snap,
             }
         )
 
         sim.current_time = utils.add_minutes_to_time(sim.current_time, config.SIMULATION_SPEED_MINUTES)
+        sim._current_min += config.SIMULATION_SPEED_MINUTES
 
-        if len(sim.completed_missions) >= len(sim.orders_map):
+        if sim._n_completed >= len(sim.orders_map):
             break
 
     return timeline
 
 
-@st.cache_data(show_spinner=False)
+_TIMELINE_CACHE_DIR = Path(".timeline_cache")
+"""On-disk cache for traced timelines. `st.cache_data` is process-local and
+flushed on every Streamlit restart, but `run_with_trace` is deterministic for
+a fixed scenario + strategy, so results are also pickled here keyed on a
+fingerprint of the scenario and the relevant config parameters. The
+in-process layer on get_timeline is st.cache_resource, which shares the
+list by reference; treat cached timelines as read-only."""
+
+
+def _scenario_fingerprint() -> str:
+    """Hash of everything that can change the traced timeline."""
+    parts = [
+        f"{o.order_id},{o.pickup_lat},{o.pickup_lng},{o.dropoff_lat},{o.dropoff_lng},{o.created_time},{o.deadline}"
+        for o in ORDERS
+    ]
+    parts += [
+        f"{d.driver_id},{d.start_lat},{d.start_lng},{d.vehicle_type},{d.capacity},{d.available_from}"
+        for d in DRIVERS
+    ]
+    parts.append(
+        f"{config.SIMULATION_SPEED_MINUTES},{config.AVG_SPEED_KMH},{config.SERVICE_TIME_MINS},"
+        f"{config.BATCH_WINDOW_MINS},{config.MIN_BATCH_SIZE},{config.MAX_BUNDLE_SIZE},"
+        f"{config.MAX_DELIVERY_TIME_MINS},{config.USE_ROAD_DISTANCE}"
+    )
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
 def get_timeline(strategy: str) -> List[Dict]:
-    return run_with_trace(strategy)
+    # cache_resource shares the returned list by reference across reruns
+    # (no pickle round-trip per slider move, unlike cache_data); the UI
+    # below only ever reads the timeline, never mutates it.
+    cache_file = _TIMELINE_CACHE_DIR / f"{strategy}-{_scenario_fingerprint()}.pkl"
+    if cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                return pickle.load(f)
+        except (pickle.PickleError, EOFError, OSError):
+            pass  # Corrupt or unreadable cache entry; re-trace below.
+    timeline = run_with_trace(strategy)
+    try:
+        _TIMELINE_CACHE_DIR.mkdir(exist_ok=True)
+        with cache_file.open("wb") as f:
+            pickle.dump(timeline, f)
+    except OSError:
+        pass  # Caching is best-effort; the trace itself still succeeded.
+    return timeline
 
 
 # -----------------------------------------------------------------------------
 # Map helpers
 # -----------------------------------------------------------------------------
 
+# Color lookup tables indexed by status (rows are RGB).
+_DRIVER_COLORS = {
+    "IDLE": [100, 116, 139],
+    "ACCRUING": [59, 130, 246],
+    "DELIVERING": [16, 185, 129],
+}
+_DRIVER_COLOR_DEFAULT = [148, 163, 184]
+
+_ORDER_STATUS_LUT = np.array(["completed", "pending", "in_flight"])
+_ORDER_COLOR_LUT = np.array([[16, 185, 129], [251, 191, 36], [59, 130, 246]])
+
+
+@st.cache_data(show_spinner=False)
+def order_points_df() -> pd.DataFrame:
+    """Static pickup/dropoff coordinate table. Built once; per-tick
+    rendering only recomputes the status/color columns on a copy."""
+    rows = []
+    for o in ORDERS:
+        rows.append({"order_id": o.order_id, "lng": o.pickup_lng, "lat": o.pickup_lat, "label": f"{o.order_id} pickup"})
+        rows.append({"order_id": o.order_id, "lng": o.dropoff_lng, "lat": o.dropoff_lat, "label": f"{o.order_id} dropoff"})
+    return pd.DataFrame(rows)
+
+
 def driver_layer(drivers: List[Dict]) -> pdk.Layer:
-    color_map = {
-        "IDLE": [100, 116, 139],
-        "ACCRUING": [59, 130, 246],
-        "DELIVERING": [16, 185, 129],
-    }
-    data = [
+    df = pd.DataFrame(
         {
-            "position": [d["lng"], d["lat"]],
-            "status": d["status"],
-            "color": color_map.get(d["status"], [148, 163, 184]),
-            "label": d["id"],
+            "lng": [d["lng"] for d in drivers],
+            "lat": [d["lat"] for d in drivers],
+            "status": [d["status"] for d in drivers],
+            "label": [d["id"] for d in drivers],
         }
-        for d in drivers
-    ]
+    )
+    df["color"] = [_DRIVER_COLORS.get(s, _DRIVER_COLOR_DEFAULT) for s in df["status"]]
     return pdk.Layer(
         "ScatterplotLayer",
-        data,
-        get_position="position",
+        df,
+        get_position=["lng", "lat"],
         get_fill_color="color",
         get_radius=90,
         pickable=True,
@@ -235,24 +314,19 @@ def driver_layer(drivers: List[Dict]) -> pdk.Layer:
     )
 
 
-def order_layer(orders: List[Order], pending_ids: List[str], completed_ids: List[str]) -> pdk.Layer:
-    data = []
-    for o in orders:
-        if o.order_id in completed_ids:
-            status = "completed"
-            color = [16, 185, 129]
-        elif o.order_id in pending_ids:
-            status = "pending"
-            color = [251, 191, 36]
-        else:
-            status = "in_flight"
-            color = [59, 130, 246]
-        data.append({"position": [o.pickup_lng, o.pickup_lat], "status": status, "label": f"{o.order_id} pickup", "color": color})
-        data.append({"position": [o.dropoff_lng, o.dropoff_lat], "status": status, "label": f"{o.order_id} dropoff", "color": color})
+def order_layer(pending_ids: List[str], completed_ids: List[str]) -> pdk.Layer:
+    df = order_points_df().copy()
+    status_idx = np.where(
+        df["order_id"].isin(completed_ids),
+        0,
+        np.where(df["order_id"].isin(pending_ids), 1, 2),
+    )
+    df["status"] = _ORDER_STATUS_LUT[status_idx]
+    df["color"] = _ORDER_COLOR_LUT[status_idx].tolist()
     return pdk.Layer(
         "ScatterplotLayer",
-        data,
-        get_position="position",
+        df,
+        get_position=["lng", "lat"],
         get_fill_color="color",
         get_radius=70,
         opacity=0.6,
@@ -319,7 +393,7 @@ center_lng = sum(o.pickup_lng for o in ORDERS) / len(ORDERS)
 view_state = pdk.ViewState(latitude=center_lat, longitude=center_lng, zoom=13)
 
 layers = [
-    order_layer(ORDERS, current["pending"], current["completed"]),
+    order_layer(current["pending"], current["completed"]),
     driver_layer(current["drivers"]),
 ]
 